@@ -25,7 +25,12 @@ a = Analysis(
         'keyring.backends.SecretService',
         'customtkinter',
         'aiohttp',
-        'PIL'
+        'PIL',
+        # providers and file parsers are registered as "module:attr" strings
+        # and imported on demand, which the analysis can't follow
+        'autolog.providers.kimai',
+        'autolog.providers.odoo',
+        'autolog.parsers.pandas_parsers',
     ],
     hookspath=[],
     hooksconfig={},
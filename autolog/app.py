@@ -3,8 +3,10 @@
 import logging
 import threading
 import tkinter as tk
+import uuid
 import webbrowser
 from pathlib import Path
+from queue import Empty, Queue
 from tkinter import filedialog, messagebox, ttk
 from typing import List, Optional
 
@@ -17,22 +19,32 @@ from autolog.constants import (
     APP_MIN_HEIGHT,
     APP_MIN_WIDTH,
     APP_WIDTH,
+    LOAD_POLL_MS,
+    STATS_REFRESH_MS,
     STATUS_DISPLAY,
     TABLE_COLUMN_WIDTHS,
+    UPDATE_CHECK_DELAY_MS,
     ColumnID,
 )
-from autolog.keyring_manager import CredentialManager
+from autolog.daemon import DaemonClient, entry_to_json
+from autolog.exceptions import LoadCancelledError
+from autolog.keyring_manager import DEFAULT_PROFILE, CredentialManager
 from autolog.logging_config import LOGGING_FILE
 from autolog.models import ProcessingResult, WorklogEntry
 from autolog.parsers.file_parsers import get_supported_formats
-from autolog.update_helpers import get_latest_release_info, is_update_available
+from autolog.run_report import REPORTS_DIR, RunReport
+from autolog.update_helpers import (
+    get_latest_release_info,
+    is_update_available,
+    update_check_enabled,
+)
 from autolog.widgets import (
     CellTooltip,
     CredentialsFrame,
     FileSelectorFrame,
     OptionsFrame,
 )
-from autolog.worklog_processor import WorklogProcessor
+from autolog.worklog_processor import PROCESSABLE_STATUSES, WorklogProcessor
 
 ctk.set_appearance_mode("System")
 ctk.set_default_color_theme("blue")
@@ -51,15 +63,23 @@ class WorklogApp(ctk.CTk):
         self.entries: List[WorklogEntry] = []
         self.editing_entry: Optional[ctk.CTkEntry] = None
         self.processor: Optional[WorklogProcessor] = None
+        # "done/total" of the running batch, refreshed with live throughput
+        self._progress_text: Optional[str] = None
+        # set to stop the file load in progress, None when not loading
+        self._load_cancel: Optional[threading.Event] = None
+        # job of a run posted by the AutoLog service, None if run in-process
+        self._remote_job: Optional[str] = None
+        self._remote_paused = False
         self._create_widgets()
         self._load_credentials()
         self._setup_treeview()
 
-        self.after(100, self._check_for_updates)
+        if update_check_enabled():
+            self.after(UPDATE_CHECK_DELAY_MS, self._check_for_updates)
 
     def _create_widgets(self) -> None:
         """Initialize and arrange all UI components."""
-        self.credentials_frame = CredentialsFrame(self)
+        self.credentials_frame = CredentialsFrame(self, self._load_credentials)
         self.credentials_frame.pack(pady=10, padx=10, fill="x")
 
         self.options_frame = OptionsFrame(self)
@@ -131,10 +151,30 @@ class WorklogApp(ctk.CTk):
         self.progress_color = self._apply_appearance_mode(
             ctk.ThemeManager.theme["CTkProgressBar"]["progress_color"]
         )
+        buttons_frame = ctk.CTkFrame(self, fg_color="transparent")
+        buttons_frame.pack(pady=10)
         self.process_btn = ctk.CTkButton(
-            self, text="Process", command=self._start_processing, state="disabled"
+            buttons_frame,
+            text="Process",
+            command=self._start_processing,
+            state="disabled",
+        )
+        self.process_btn.pack(side="left", padx=5)
+        self.pause_btn = ctk.CTkButton(
+            buttons_frame, text="Pause", command=self._toggle_pause, state="disabled"
+        )
+        self.pause_btn.pack(side="left", padx=5)
+        self.cancel_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Cancel",
+            command=self._cancel,
+            state="disabled",
+        )
+        self.cancel_btn.pack(side="left", padx=5)
+        self.undo_btn = ctk.CTkButton(
+            buttons_frame, text="Undo run...", command=self._undo_run
         )
-        self.process_btn.pack(pady=10)
+        self.undo_btn.pack(side="left", padx=5)
 
     def _setup_treeview(self) -> None:
         """Bind events to the treeview."""
@@ -151,7 +191,12 @@ class WorklogApp(ctk.CTk):
 
     def _handle_issue_cell_edit(self, row_id: str, column: str) -> None:
         """Enable editing of an issue key cell."""
-        if self.tree.set(row_id, "Status") == STATUS_DISPLAY["success"]:
+        if self._loading:
+            return
+        if self.tree.set(row_id, "Status") in (
+            STATUS_DISPLAY["success"],
+            STATUS_DISPLAY["unchanged"],
+        ):
             return
         current_value = self.tree.set(row_id, "Issue")
         index = self.tree.index(row_id)
@@ -173,6 +218,7 @@ class WorklogApp(ctk.CTk):
         self.tree.set(row_id, column="Status", value=STATUS_DISPLAY["pending"])
         self.tree.set(row_id, column="Error", value="")
         self._cancel_edit()
+        self._start_warm_up()
 
     def _cancel_edit(self) -> None:
         """Cancel the current edit operation."""
@@ -180,9 +226,10 @@ class WorklogApp(ctk.CTk):
             self.editing_entry.destroy()
             self.editing_entry = None
 
-    def _load_credentials(self) -> None:
-        """Populate credential fields with saved values."""
-        base_url, email, api_key = CredentialManager.get_credentials()
+    def _load_credentials(self, profile: str = DEFAULT_PROFILE) -> None:
+        """Populate credential fields with the saved values of a profile."""
+        self.credentials_frame.set_profiles(CredentialManager.get_profiles(), profile)
+        base_url, email, api_key = CredentialManager.get_credentials(profile)
         if any([base_url, email, api_key]):
             self.credentials_frame.load_credentials(base_url, email, api_key)
 
@@ -195,59 +242,199 @@ class WorklogApp(ctk.CTk):
             self._load_entries(Path(file_path))
 
     def _load_entries(self, file_path: Path) -> None:
-        """Initialize processor and load entries from CSV."""
-        self.processor = WorklogProcessor(
+        """Load entries in a background thread, aborting any load in progress."""
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+        if self.processor:
+            self.processor.cancel_warm_up()
+        self.processor = self._new_processor()
+        self.entries = []
+        self.tree.delete(*self.tree.get_children())
+        self.process_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self._update_status(f"Loading {file_path.name}...")
+
+        cancel_event = self._load_cancel = threading.Event()
+        results: Queue = Queue()
+        processor = self.processor
+        options = {
+            "provider": self.file_frame.provider_name,
+            "skip_imported": self.options_frame.skip_imported_var.get(),
+            "sheets": self.file_frame.sheets,
+        }
+
+        def _worker():
+            try:
+                entries, total_hours = processor.load_entries(
+                    file_path,
+                    on_batch=lambda batch: results.put(("batch", batch)),
+                    cancel_event=cancel_event,
+                    **options,
+                )
+                results.put(("done", (entries, total_hours)))
+            except LoadCancelledError:
+                pass
+            except Exception as e:
+                results.put(("error", e))
+
+        threading.Thread(target=_worker, daemon=True).start()
+        self.after(LOAD_POLL_MS, self._poll_load, file_path, results, cancel_event)
+
+    def _new_processor(self) -> WorklogProcessor:
+        return WorklogProcessor(
             self.credentials_frame.credentials,
             self.options_frame.selected_timezone,
+            use_mirror=self.options_frame.use_mirror_var.get(),
+            columnar=self.options_frame.columnar_var.get(),
+            overlap_mode=self.options_frame.overlap_mode_var.get(),
         )
-        try:
-            provider_name = self.file_frame.provider_name
-            self.entries, total_hours = self.processor.load_entries(
-                file_path, provider_name
-            )
-        except Exception as e:
-            err_str = str(e)
-            self._update_status("Failed Loading Entries")
-            self._show_error("Error", f"Failed Loading Entries\n{err_str}")
-        else:
-            if self.entries:
-                self._update_status(f"Total: {total_hours}")
-                self._update_table()
-                self.process_btn.configure(state="normal")
+
+    def _poll_load(
+        self,
+        file_path: Path,
+        results: Queue,
+        cancel_event: threading.Event,
+        rows: int = 0,
+    ) -> None:
+        """Move loaded rows into the table until the load ends or is replaced."""
+        if cancel_event is not self._load_cancel:
+            return
+        if cancel_event.is_set():
+            self._finish_load()
+            self._update_status("Loading cancelled")
+            return
+        while True:
+            try:
+                kind, payload = results.get_nowait()
+            except Empty:
+                break
+            if kind == "batch":
+                self._insert_rows(payload)
+                rows += len(payload)
+                self._update_status(f"Loading {file_path.name}... {rows} rows")
+            elif kind == "error":
+                self._finish_load()
+                self._update_status("Failed Loading Entries")
+                self._show_error("Error", f"Failed Loading Entries\n{payload}")
+                return
             else:
-                self._update_table()
-                self._update_status("Couldn't parse any entry")
+                self._finish_load()
+                self.entries, total_hours = payload
+                self._refresh_statuses()
+                if self.entries:
+                    self._update_status(self._format_load_summary(total_hours))
+                    self.process_btn.configure(state="normal")
+                    self._start_warm_up()
+                else:
+                    self._update_status("Couldn't parse any entry")
+                return
+        self.after(
+            LOAD_POLL_MS, self._poll_load, file_path, results, cancel_event, rows
+        )
 
-    def _update_table(self) -> None:
-        """Refresh the treeview with current entries."""
-        self.tree.delete(*self.tree.get_children())
-        for entry in self.entries:
+    def _finish_load(self) -> None:
+        """Leave the loading state once a load ended either way."""
+        self._load_cancel = None
+        self.cancel_btn.configure(state="disabled")
+
+    @property
+    def _loading(self) -> bool:
+        return self._load_cancel is not None
+
+    def _format_load_summary(self, total_hours: str) -> str:
+        """Build the status text shown after a file is loaded."""
+        counts = self.processor.import_counts
+        summary = f"Total: {total_hours}"
+        if counts.get("unchanged"):
+            summary += (
+                f" | New: {counts['new']}, Changed: {counts['changed']}, "
+                f"Already imported: {counts['unchanged']}"
+            )
+        if self.processor.ambiguous_dates:
+            summary += (
+                f" | Ambiguous dates: {len(self.processor.ambiguous_dates)} "
+                "(read month-first)"
+            )
+        if self.processor.duplicate_count:
+            summary += f" | Duplicates in file: {self.processor.duplicate_count}"
+        return summary
+
+    def _start_warm_up(self) -> None:
+        """Preload Jira worklogs in the background while the user reviews."""
+        if DaemonClient().available():
+            return  # the service posts the entries, with its own warm sessions
+        if self.processor and self.entries and all(self.processor.credentials):
+            self.processor.warm_up(
+                self.entries, self.options_frame.prevent_duplicates_var.get()
+            )
+
+    def _insert_rows(self, entries: List[WorklogEntry]) -> None:
+        """Append rows for the given entries to the treeview."""
+        for entry in entries:
             duration_str = f"{entry.duration // 3600}h {(entry.duration % 3600) // 60}m"
+            # rows are found by entry index when results come in
             self.tree.insert(
                 "",
                 "end",
+                iid=str(entry._idx),
                 values=(
                     entry.started.strftime("%Y-%m-%d %H:%M"),
                     duration_str,
                     entry.issue_key or "⚠️ Missing",
                     STATUS_DISPLAY.get(entry.status, STATUS_DISPLAY["pending"]),
-                    "",
+                    self._row_note(entry),
                 ),
             )
 
+    def _refresh_statuses(self) -> None:
+        """Show statuses set once loading finished, e.g. already imported rows."""
+        rows = self.tree.get_children()
+        for row, entry in zip(rows, self.entries, strict=True):
+            if entry.status != "pending":
+                self.tree.set(row, "Status", STATUS_DISPLAY[entry.status])
+                self.tree.set(row, "Error", self._row_note(entry))
+
+    def _row_note(self, entry: WorklogEntry) -> str:
+        """Error column text shown for a freshly loaded entry."""
+        if entry.status == "duplicate":
+            return f"Duplicate of row {entry.duplicate_of + 1}"
+        return ""
+
     def _start_processing(self) -> None:
         """Validate credentials and start processing in a background thread."""
         if not all(self.credentials_frame.credentials):
             self._show_error("Error", "Please fill all credentials fields")
             return
-        CredentialManager.save_credentials(*self.credentials_frame.credentials)
+        CredentialManager.save_credentials(
+            *self.credentials_frame.credentials,
+            profile=self.credentials_frame.profile or DEFAULT_PROFILE,
+        )
+        self.processor.update_credentials(self.credentials_frame.credentials)
+        # options may have been changed after the file was loaded
+        self.processor.update_settings(
+            self.options_frame.use_mirror_var.get(),
+            self.options_frame.overlap_mode_var.get(),
+        )
         self.process_btn.configure(state="disabled")
+        self.pause_btn.configure(state="normal", text="Pause")
+        self.cancel_btn.configure(state="normal")
         self._update_progress(0, self.progress_color)
         self._update_status("Connecting to Jira...")
-        self._processing_thread = threading.Thread(
-            target=self._process_entries, daemon=True
-        )
+        daemon = DaemonClient()
+        if daemon.available():
+            self._remote_job = uuid.uuid4().hex
+            self._remote_paused = False
+            self._processing_thread = threading.Thread(
+                target=self._process_remote, args=(daemon,), daemon=True
+            )
+        else:
+            self._processing_thread = threading.Thread(
+                target=self._process_entries, daemon=True
+            )
         self._processing_thread.start()
+        self._progress_text = None
+        if self._remote_job is None:
+            self.after(STATS_REFRESH_MS, self._refresh_stats)
 
     def _process_entries(self) -> None:
         """Execute processing and handle results."""
@@ -258,14 +445,20 @@ class WorklogApp(ctk.CTk):
             ) -> None:
                 self._update_row_status(entry._idx, entry, result)
                 self._update_progress((idx + 1) / total)
-                self._update_status(f"{idx + 1}/{total}")
+                self._progress_text = f"{idx + 1}/{total}"
+                stats = self.processor.throughput_stats()
+                self._update_status(f"{self._progress_text} | {stats}")
 
             self.processor.process_entries(
                 self.entries, callback, self.options_frame.prevent_duplicates_var.get()
             )
-            self._update_progress(color="green")
-            self._update_status("Finished")
-            self._show_results()
+            report = self.processor.report
+            self._finish_run(
+                self.processor.total,
+                self.processor.counts,
+                report.path if report else None,
+                self.processor.cancelled,
+            )
 
         except JIRAError as e:
             self._show_error("Error", f"Jira error: {e.text}")
@@ -274,19 +467,231 @@ class WorklogApp(ctk.CTk):
             self._show_error("Error", f"Unexpected error: {e}")
             self._update_progress(color="red")
         finally:
-            self.process_btn.configure(state="normal")
+            self._reset_run_controls()
+
+    def _process_remote(self, daemon: DaemonClient) -> None:
+        """Post the loaded entries through the AutoLog service.
+
+        The entries are sent as loaded and edited here; the service posts them
+        with its warm sessions and streams each result back.
+        """
+        request = {
+            "op": "process_entries",
+            "job": self._remote_job,
+            "jira_profile": self.credentials_frame.profile or DEFAULT_PROFILE,
+            "timezone": self.options_frame.selected_timezone,
+            "prevent_duplicates": self.options_frame.prevent_duplicates_var.get(),
+            "overlap_mode": self.options_frame.overlap_mode_var.get(),
+            "use_mirror": self.options_frame.use_mirror_var.get(),
+            "provider": self.processor.provider_name,
+            "source": self.processor.source,
+            "entries": [
+                entry_to_json(entry)
+                for entry in self.entries
+                if entry.status in PROCESSABLE_STATUSES
+            ],
+        }
+        logger.info(f"Posting {len(request['entries'])} entries through the service")
+        try:
+            for event in daemon.request(request):
+                kind = event["event"]
+                if kind == "queued":
+                    self._update_status("Waiting for the service to finish a run...")
+                elif kind == "result":
+                    entry = self.entries[event["row"]]
+                    entry.status = event["status"]
+                    error = Exception(event["error"]) if event["error"] else None
+                    result = ProcessingResult(
+                        error is None, entry, error, warning=event["warning"]
+                    )
+                    self._update_row_status(event["row"], entry, result)
+                    self._update_progress((event["idx"] + 1) / event["total"])
+                    self._update_status(
+                        f"{event['idx'] + 1}/{event['total']} | {event['stats']}"
+                    )
+                elif kind == "error":
+                    self._show_error("Error", event["message"])
+                    self._update_progress(color="red")
+                    return
+                elif kind == "done":
+                    self._finish_run(
+                        event["total"],
+                        event["counts"],
+                        event["report"],
+                        event["cancelled"],
+                    )
+                    return
+            self._show_error("Error", "The AutoLog service closed the connection")
+        except (OSError, ValueError) as e:
+            self._show_error("Error", f"Lost the AutoLog service\n{e}")
+            self._update_progress(color="red")
+        finally:
+            self._remote_job = None
+            self._reset_run_controls()
+
+    def _finish_run(
+        self, total: int, counts: dict, report: Path | str | None, cancelled: bool
+    ) -> None:
+        """Show the outcome of a finished or cancelled run."""
+        if cancelled:
+            self._update_status("Cancelled")
+        else:
+            self._update_progress(color="green")
+            self._update_status("Finished")
+        self._show_results(total, counts, report, cancelled)
+
+    def _reset_run_controls(self) -> None:
+        self.process_btn.configure(state="normal")
+        self.pause_btn.configure(state="disabled", text="Pause")
+        self.cancel_btn.configure(state="disabled")
+        self._update_progress(0, self.progress_color)
+        self._update_status("")
+
+    def _undo_run(self) -> None:
+        """Delete the worklogs posted by a run, picked by its report."""
+        if not all(self.credentials_frame.credentials):
+            self._show_error("Error", "Please fill all credentials fields")
+            return
+        last_report = self.processor.report if self.processor else None
+        path = filedialog.askopenfilename(
+            title="Select the report of the run to undo",
+            initialdir=REPORTS_DIR,
+            initialfile=last_report.path.name if last_report else "",
+            filetypes=[["Run report", "run-*.jsonl run-*.csv"]],
+        )
+        if not path:
+            return
+        report_path = Path(path)
+        try:
+            count = len(RunReport.load_posted(report_path))
+        except (OSError, ValueError, KeyError) as e:
+            self._show_error("Error", f"Can't read run report\n{e}")
+            return
+        if not count:
+            messagebox.showinfo("Undo run", "The run didn't post any worklog")
+            return
+        if not messagebox.askyesno(
+            "Undo run",
+            f"Delete the {count} worklogs posted by {report_path.name} from Jira?",
+        ):
+            return
+        if self.processor is None:
+            self.processor = self._new_processor()
+        self.processor.update_credentials(self.credentials_frame.credentials)
+        self.process_btn.configure(state="disabled")
+        self.undo_btn.configure(state="disabled")
+        self.pause_btn.configure(state="normal", text="Pause")
+        self.cancel_btn.configure(state="normal")
+        self._update_progress(0, self.progress_color)
+        self._update_status("Connecting to Jira...")
+        self._processing_thread = threading.Thread(
+            target=self._run_undo, args=(report_path,), daemon=True
+        )
+        self._processing_thread.start()
+        self._progress_text = None
+        self.after(STATS_REFRESH_MS, self._refresh_stats)
+
+    def _run_undo(self, report_path: Path) -> None:
+        """Execute a rollback and report its outcome."""
+        processor = self.processor
+        try:
+
+            def callback(
+                idx: int, total: int, entry: WorklogEntry, result: ProcessingResult
+            ) -> None:
+                self._update_progress(idx / total)
+                self._progress_text = f"Deleted {idx}/{total}"
+                stats = processor.throughput_stats()
+                self._update_status(f"{self._progress_text} | {stats}")
+
+            processor.undo_run(report_path, callback)
+            deleted = processor.counts["deleted"]
+            detail = f"Report:\n{processor.report.path}" if processor.report else None
+            message = f"Deleted {deleted}/{processor.total} worklogs"
+            if processor.counts["skipped"]:
+                message += f"\n{processor.counts['skipped']} were already deleted"
+            if processor.counts["failed"]:
+                message += f"\n{processor.counts['failed']} failed, see the report"
+            message += "\nLoad the file again to post its entries anew"
+            title = "Undo Cancelled" if processor.cancelled else "Undo Complete"
+            messagebox.showinfo(title, message, detail=detail)
+        except JIRAError as e:
+            self._show_error("Error", f"Jira error: {e.text}")
+        except Exception as e:
+            self._show_error("Error", f"Unexpected error: {e}")
+        finally:
+            if self.entries:
+                self.process_btn.configure(state="normal")
+            self.undo_btn.configure(state="normal")
+            self.pause_btn.configure(state="disabled", text="Pause")
+            self.cancel_btn.configure(state="disabled")
             self._update_progress(0, self.progress_color)
             self._update_status("")
 
+    def _refresh_stats(self) -> None:
+        """Keep the readout current while no entry completes, e.g. on a 429."""
+        if not self._processing_thread.is_alive():
+            return
+        processor = self.processor
+        if self._progress_text and not (processor.paused or processor.cancelled):
+            stats = processor.throughput_stats()
+            self._update_status(f"{self._progress_text} | {stats}")
+        self.after(STATS_REFRESH_MS, self._refresh_stats)
+
+    def _toggle_pause(self) -> None:
+        """Pause or resume the running processor, or the service's run."""
+        if self._remote_job is not None:
+            paused = self._remote_paused
+            self._control_remote("resume" if paused else "pause")
+            self._remote_paused = not paused
+        else:
+            paused = self.processor.paused
+            if paused:
+                self.processor.resume()
+            else:
+                self.processor.pause()
+        if paused:
+            self.pause_btn.configure(text="Pause")
+        else:
+            self.pause_btn.configure(text="Resume")
+            self._update_status("Paused")
+
+    def _control_remote(self, op: str) -> None:
+        """Pause, resume or cancel the run posted by the service."""
+        try:
+            DaemonClient().control(op, self._remote_job)
+        except (OSError, ValueError, StopIteration) as e:
+            logger.warning(f"Could not {op} the service's run: {e}")
+
+    def _cancel(self) -> None:
+        """Cancel the file load or processing run in progress."""
+        if self._loading:
+            self._load_cancel.set()
+            self._update_status("Cancelling...")
+        else:
+            self._cancel_processing()
+
+    def _cancel_processing(self) -> None:
+        """Cancel the run after in-flight requests finish."""
+        if self._remote_job is not None:
+            self._control_remote("cancel")
+        else:
+            self.processor.cancel()
+        self.pause_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="disabled")
+        self._update_status("Cancelling...")
+
     def _update_row_status(
         self, idx: int, entry: WorklogEntry, result: ProcessingResult
     ) -> None:
         """Update a treeview row with processing results."""
-        row = self.tree.get_children()[idx]
+        row = str(idx)
         self.tree.set(row, "Status", STATUS_DISPLAY[entry.status])
-        self.tree.set(
-            row, "Error", "" if result.success else self._format_error(result.error)
-        )
+        if result.success:
+            note = result.warning or ""
+        else:
+            note = self._format_error(result.error)
+        self.tree.set(row, "Error", note)
 
     def _format_error(self, error: Exception) -> str:
         """Format an error message for display."""
@@ -303,18 +708,32 @@ class WorklogApp(ctk.CTk):
         """Update the status label."""
         self.status_label.configure(text=message)
 
-    def _show_results(self) -> None:
+    def _show_results(
+        self, total: int, counts: dict, report: Path | str | None, cancelled: bool
+    ) -> None:
         """Display a summary of processing results."""
-        total = self.processor.total
-        failed_count = len(self.processor.failed_entries)
-        success_count = total - failed_count
+        success_count = counts.get("success", 0)
+        failed_count = sum(counts.values()) - success_count
+        detail = f"Report:\n{report}" if report else None
+        if cancelled:
+            message = (
+                f"Cancelled after posting {success_count}/{total} worklogs\n"
+                "Press Process to continue with the remaining entries"
+            )
+            messagebox.showinfo("Processing Cancelled", message, detail=detail)
+            return
         message = (
             f"Posted {success_count}/{total} worklogs\n"
             f"{failed_count} failed - double-click to edit keys"
-            if self.processor.failed_entries
+            if failed_count
             else f"Successfully posted {success_count}/{total} worklogs"
         )
-        messagebox.showinfo("Processing Complete", message)
+        if counts.get("overlap"):
+            message += (
+                f"\n{counts['overlap']} overlap time already logged "
+                "and were not posted"
+            )
+        messagebox.showinfo("Processing Complete", message, detail=detail)
 
     def _show_error(self, title, message, **options):
         detail = options.pop("detail", None)
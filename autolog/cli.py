@@ -0,0 +1,326 @@
+"""Command line options and headless runs"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from autolog.constants import (
+    DEFAULT_TIMEZONE,
+    PROGRESS_LOG_INTERVAL_SEC,
+    QUEUE_CLAIM_SIZE,
+)
+from autolog.daemon import AutologDaemon, DaemonClient
+from autolog.keyring_manager import DEFAULT_PROFILE, CredentialManager
+from autolog.models import ProcessingResult, WorklogEntry
+from autolog.providers.factory import AUTO_PROVIDER
+from autolog.work_queue import WORK_QUEUE_FILE, WorkQueue, worker_name
+from autolog.worklog_processor import PROCESSABLE_STATUSES, WorklogProcessor
+
+logger = logging.getLogger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="autolog",
+        description="Log work entries into Jira. Opens the app unless --headless.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile loading and processing, writing reports next to the log file",
+    )
+    headless = parser.add_argument_group("headless runs")
+    headless.add_argument(
+        "--headless",
+        metavar="FILE",
+        type=Path,
+        help="load and post FILE without the app, posting while it is parsed",
+    )
+    headless.add_argument("--provider", default=AUTO_PROVIDER)
+    headless.add_argument(
+        "--jira-profile",
+        default=DEFAULT_PROFILE,
+        help="saved credentials profile to post with",
+    )
+    headless.add_argument("--timezone", default=DEFAULT_TIMEZONE)
+    headless.add_argument(
+        "--sheets", nargs="+", help="workbook sheet names or glob patterns"
+    )
+    headless.add_argument(
+        "--allow-duplicates",
+        action="store_true",
+        help="don't check Jira for existing identical worklogs",
+    )
+    headless.add_argument(
+        "--reimport",
+        action="store_true",
+        help="also post rows already imported from this file",
+    )
+    headless.add_argument("--overlap", choices=["off", "flag", "skip"], default="off")
+    headless.add_argument(
+        "--mirror", action="store_true", help="sync the local worklog mirror"
+    )
+    headless.add_argument(
+        "--columnar",
+        action="store_true",
+        help="keep loaded rows in compact columns, for very large files",
+    )
+    headless.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="run in this process even if the AutoLog service is running",
+    )
+    queue = parser.add_argument_group("shared work queue")
+    queue.add_argument(
+        "--queue",
+        metavar="DB",
+        type=Path,
+        default=WORK_QUEUE_FILE,
+        help="work queue database, e.g. on a drive shared by all workers",
+    )
+    queue.add_argument(
+        "--enqueue",
+        metavar="FILE",
+        type=Path,
+        help="load FILE and add its rows to the work queue without posting them",
+    )
+    queue.add_argument(
+        "--worker",
+        action="store_true",
+        help="post queued rows with --jira-profile until the queue is empty",
+    )
+    queue.add_argument(
+        "--claim-size",
+        type=int,
+        default=QUEUE_CLAIM_SIZE,
+        help="rows a worker leases at once",
+    )
+    parser.add_argument(
+        "--undo",
+        metavar="REPORT",
+        type=Path,
+        help="delete the worklogs posted by the run of a run report",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="run the AutoLog service, keeping Jira sessions warm between runs",
+    )
+    return parser
+
+
+def _log_result(
+    idx: int, total: int, entry: WorklogEntry, result: ProcessingResult
+) -> None:
+    """Progress callback of runs in this process: logs rows worth a look."""
+    if not result.success:
+        logger.warning("Row %d %s: %s", entry._idx + 1, entry.status, result.error)
+    elif result.warning:
+        logger.warning("Row %d posted: %s", entry._idx + 1, result.warning)
+
+
+def run_undo(args: argparse.Namespace) -> int:
+    """Delete the worklogs a run report lists as posted; returns the exit code."""
+    credentials = CredentialManager.get_credentials(args.jira_profile)
+    if not all(credentials):
+        logger.error(f"No credentials saved for Jira profile '{args.jira_profile}'")
+        return 2
+
+    processor = WorklogProcessor(credentials, args.timezone)
+    try:
+        processor.undo_run(args.undo, _log_result)
+    except Exception as e:
+        logger.error(f"Undo failed: {e}")
+        return 1
+    counts = processor.counts
+    logger.info(
+        f"Deleted {counts['deleted']}/{processor.total} worklogs, "
+        f"{counts['skipped']} already deleted, {counts['failed']} failed"
+    )
+    if processor.report is not None:
+        logger.info(f"Report: {processor.report.path}")
+    return 1 if counts["failed"] else 0
+
+
+def _log_queue(queue: WorkQueue) -> None:
+    counts = queue.counts()
+    logger.info(
+        f"Queue {queue.path}: {counts.get('pending', 0)} pending, "
+        f"{counts.get('leased', 0)} leased, {counts.get('success', 0)} posted, "
+        f"{counts.get('skipped', 0)} skipped, "
+        f"{counts.get('overlap', 0)} overlapping, {counts.get('failed', 0)} failed"
+    )
+
+
+def run_enqueue(args: argparse.Namespace) -> int:
+    """Add the rows of a file to the shared work queue."""
+    # loading needs no connection, the credentials are only passed along
+    credentials = CredentialManager.get_credentials(args.jira_profile)
+    processor = WorklogProcessor(
+        credentials, args.timezone, columnar=args.columnar, report_format=None
+    )
+    try:
+        entries, _ = processor.load_entries(
+            args.enqueue,
+            args.provider,
+            skip_imported=not args.reimport,
+            sheets=args.sheets,
+        )
+        queue = WorkQueue(args.queue)
+        added = queue.enqueue(
+            processor.provider_name,
+            processor.source,
+            [e for e in entries if e.status in PROCESSABLE_STATUSES],
+        )
+    except Exception as e:
+        logger.error(f"Enqueue failed: {e}")
+        return 1
+    logger.info(f"Queued {added} rows of {args.enqueue.name}")
+    _log_queue(queue)
+    return 0
+
+
+def run_worker(args: argparse.Namespace) -> int:
+    """Post rows from the shared work queue until it is drained."""
+    credentials = CredentialManager.get_credentials(args.jira_profile)
+    if not all(credentials):
+        logger.error(f"No credentials saved for Jira profile '{args.jira_profile}'")
+        return 2
+
+    processor = WorklogProcessor(
+        credentials,
+        args.timezone,
+        use_mirror=args.mirror,
+        overlap_mode=args.overlap,
+    )
+    worker = worker_name(args.jira_profile)
+    logger.info(f"Working queue {args.queue} as {worker}")
+    try:
+        queue = WorkQueue(args.queue)
+        processor.process_queue(queue, worker, _log_result, args.claim_size)
+    except KeyboardInterrupt:
+        logger.info("Worker stopped, unfinished rows were returned to the queue")
+    except Exception as e:
+        logger.error(f"Worker failed: {e}")
+        return 1
+    counts = processor.counts
+    logger.info(
+        f"This worker posted {counts['success']}/{processor.processed_count} rows, "
+        f"{counts['skipped']} skipped, {counts['overlap']} overlapping, "
+        f"{counts['failed']} failed"
+    )
+    if processor.report is not None:
+        logger.info(f"Report: {processor.report.path}")
+    _log_queue(queue)
+    return 1 if processor.counts["failed"] else 0
+
+
+def run_daemon() -> int:
+    try:
+        AutologDaemon().serve_forever()
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _run_remote(args: argparse.Namespace, client: DaemonClient) -> int:
+    """Submit the headless run to the AutoLog service and follow its progress."""
+    request = {
+        "op": "process_file",
+        "file": str(args.headless.resolve()),
+        "provider": args.provider,
+        "jira_profile": args.jira_profile,
+        "timezone": args.timezone,
+        "sheets": args.sheets,
+        "prevent_duplicates": not args.allow_duplicates,
+        "skip_imported": not args.reimport,
+        "overlap_mode": args.overlap,
+        "use_mirror": args.mirror,
+        "columnar": args.columnar,
+    }
+    logger.info(f"Submitting {args.headless.name} to the AutoLog service")
+    last_logged = time.monotonic()
+    for event in client.request(request):
+        kind = event["event"]
+        if kind == "queued":
+            logger.info("Waiting for the service to finish another run")
+        elif kind == "result":
+            if event["error"]:
+                logger.warning(
+                    "Row %d %s: %s", event["row"] + 1, event["status"], event["error"]
+                )
+            elif event.get("warning"):
+                logger.warning("Row %d posted: %s", event["row"] + 1, event["warning"])
+            now = time.monotonic()
+            if now - last_logged >= PROGRESS_LOG_INTERVAL_SEC:
+                last_logged = now
+                logger.info(
+                    "Progress %d/%d | %s", event["idx"], event["total"], event["stats"]
+                )
+        elif kind == "error":
+            logger.error(f"Run failed: {event['message']}")
+            return 1
+        elif kind == "done":
+            counts = event["counts"]
+            _log_summary(counts, event["total"], event["duplicates"], event["report"])
+            return 1 if counts.get("failed") else 0
+    logger.error("The AutoLog service closed the connection")
+    return 1
+
+
+def _log_summary(counts: dict, total: int, duplicates: int, report: str | None) -> None:
+    logger.info(
+        f"Posted {counts.get('success', 0)}/{total} worklogs, "
+        f"{counts.get('skipped', 0)} skipped, {counts.get('overlap', 0)} overlapping, "
+        f"{counts.get('failed', 0)} failed, {duplicates} duplicates in file"
+    )
+    if report:
+        logger.info(f"Report: {report}")
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    """Post a file with saved credentials; returns the process exit code.
+
+    The run goes through the AutoLog service when one is running.
+    """
+    client = DaemonClient()
+    if not args.no_daemon and client.available():
+        return _run_remote(args, client)
+
+    credentials = CredentialManager.get_credentials(args.jira_profile)
+    if not all(credentials):
+        logger.error(f"No credentials saved for Jira profile '{args.jira_profile}'")
+        return 2
+
+    processor = WorklogProcessor(
+        credentials,
+        args.timezone,
+        use_mirror=args.mirror,
+        columnar=args.columnar,
+        overlap_mode=args.overlap,
+    )
+    try:
+        processor.process_file(
+            args.headless,
+            args.provider,
+            _log_result,
+            prevent_duplicates=not args.allow_duplicates,
+            skip_imported=not args.reimport,
+            sheets=args.sheets,
+        )
+    except Exception as e:
+        logger.error(f"Run failed: {e}")
+        return 1
+
+    report = processor.report
+    _log_summary(
+        processor.counts,
+        processor.total,
+        processor.duplicate_count,
+        str(report.path) if report else None,
+    )
+    return 1 if processor.counts["failed"] else 0
@@ -1,4 +1,6 @@
+import os
 from enum import Enum
+from pathlib import Path
 from typing import Dict
 
 APP_WIDTH = 800
@@ -7,9 +9,59 @@ APP_HEIGHT = 600
 APP_MIN_WIDTH = 650
 APP_MIN_HEIGHT = 500
 
+# let the window and any file load settle before touching the network
+UPDATE_CHECK_DELAY_MS = 5000
+# refresh of the throughput readout while processing
+STATS_REFRESH_MS = 1000
+# how often the table takes rows from a file being loaded
+LOAD_POLL_MS = 100
+# rows handed to the table at once while a file loads
+LOAD_BATCH_SIZE = 500
+
+DATA_DIR = Path.home() / os.environ.get("AUTOLOG_DATA_DIR", ".autolog")
+
+DEFAULT_TIMEZONE = "Asia/Damascus"
+
 COOLDOWN_SEC: float = 2.0
 COOLDOWN_EVERY: int = 10
 
+# overlaps shorter than this are tolerated, e.g. back-to-back entries
+OVERLAP_TOLERANCE_SEC: float = 60.0
+# "user": any of the user's worklogs; "issue": only worklogs on the same issue
+OVERLAP_SCOPE: str = "user"
+# the user's worklogs on other issues are fetched for at least this many days
+OVERLAP_FETCH_DAYS: int = 7
+
+RETRY_MAX_ATTEMPTS: int = 5
+RETRY_BUDGET: int = 100
+RETRY_BASE_SEC: float = 1.0
+RETRY_MAX_SEC: float = 60.0
+
+# worklogs deleted concurrently when a run is undone
+ROLLBACK_WORKERS: int = 4
+
+# throughput, ETA and latency are measured over this trailing window
+THROUGHPUT_WINDOW_SEC: float = 60.0
+# how often progress is written to the log during a run
+PROGRESS_LOG_INTERVAL_SEC: float = 10.0
+
+# socket of the optional background service (main.py --daemon)
+DAEMON_SOCKET = DATA_DIR / "autolog.sock"
+# sessions, caches and credentials unused for this long are dropped
+DAEMON_IDLE_TTL_SEC: float = 900.0
+
+# entries buffered between two stages of a pipelined run
+PIPELINE_QUEUE_SIZE: int = 100
+# how often a stage blocked on a queue checks for cancellation
+PIPELINE_POLL_SEC: float = 0.2
+
+# entries a worker of the shared work queue claims at once
+QUEUE_CLAIM_SIZE: int = 50
+# claimed entries go back to the queue if their worker stops renewing them
+QUEUE_LEASE_SEC: float = 300.0
+# how often an idle worker checks for leases of other workers to expire
+QUEUE_POLL_SEC: float = 5.0
+
 TABLE_COLUMN_WIDTHS: Dict[str, int] = {
     "Started": 160,
     "Duration": 100,
@@ -32,4 +84,11 @@ STATUS_DISPLAY = {
     "success": "✅ Success",
     "failed": "❌ Failed",
     "skipped": "⏭️ Skipped",
+    "unchanged": "☑️ Imported",
+    # repeated row within the loaded file, never sent to Jira
+    "duplicate": "⏭️ Skipped",
+    # removed again from Jira by undoing a run
+    "deleted": "↩️ Deleted",
+    # not posted for overlapping time already logged, posted once that is fixed
+    "overlap": "⏸️ Overlap",
 }
@@ -0,0 +1,356 @@
+"""Local background service keeping Jira sessions and caches warm"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+from autolog.__version__ import version
+from autolog.constants import DAEMON_IDLE_TTL_SEC, DAEMON_SOCKET
+from autolog.exceptions import error_text
+from autolog.keyring_manager import DEFAULT_PROFILE, CredentialManager
+from autolog.models import ProcessingResult, WorklogEntry
+from autolog.routing import RoutingRules
+from autolog.worklog_processor import PROCESSABLE_STATUSES, WorklogProcessor
+
+logger = logging.getLogger(__name__)
+
+
+# requests that pause, resume or cancel a submitted job
+CONTROL_OPS = ("pause", "resume", "cancel")
+
+
+def daemon_supported() -> bool:
+    # no Unix sockets in Python on Windows
+    return hasattr(socketserver, "UnixStreamServer")
+
+
+def entry_to_json(entry: WorklogEntry) -> dict:
+    """An entry as sent to the service by a client that loaded it."""
+    return {
+        "row": entry._idx,
+        "started": entry.started.isoformat(),
+        "duration": entry.duration,
+        "activity": entry.activity,
+        "description": entry.description,
+        "timezone": entry.timezone,
+        "raw_issue_key": entry.raw_issue_key,
+        "issue_key": entry.issue_key,
+        "status": entry.status,
+        "sheet": entry.sheet,
+    }
+
+
+def entry_from_json(data: dict) -> WorklogEntry:
+    return WorklogEntry(
+        started=datetime.fromisoformat(data["started"]),
+        duration=data["duration"],
+        activity=data["activity"],
+        description=data["description"],
+        timezone=data["timezone"],
+        raw_issue_key=data["raw_issue_key"],
+        issue_key=data["issue_key"],
+        status=data["status"],
+        sheet=data["sheet"],
+        _idx=data["row"],
+    )
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and streams JSON event lines back."""
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            self._send({"event": "error", "message": "Invalid request"})
+            return
+        op = request.get("op")
+        try:
+            if op == "ping":
+                self._send({"event": "pong", "version": version})
+            elif op == "shutdown":
+                self._send({"event": "done"})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            elif op == "process_file":
+                self.server.service.process_file(request, self._send)
+            elif op == "process_entries":
+                self.server.service.process_entries(request, self._send)
+            elif op in CONTROL_OPS:
+                found = self.server.service.control(op, request.get("job"))
+                self._send({"event": "done", "found": found})
+            else:
+                self._send({"event": "error", "message": f"Unknown op '{op}'"})
+        except OSError:
+            # the client went away, e.g. the CLI was interrupted
+            logger.info(f"Client disconnected during '{op}'")
+
+    def _send(self, message: dict) -> None:
+        self.wfile.write(json.dumps(message).encode() + b"\n")
+        self.wfile.flush()
+
+
+if daemon_supported():
+
+    class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+        service: "AutologDaemon"
+
+
+class AutologDaemon:
+    """
+    Runs load/process jobs submitted over a Unix socket.
+
+    Files are loaded by the service itself; the app submits the entries it
+    loaded instead, as they may have been edited in its table.
+
+    Processors, and with them the connected Jira clients and their worklog
+    mirrors, are kept per credential profile and settings between jobs, and
+    dropped after DAEMON_IDLE_TTL_SEC unused. Cached worklogs and saved
+    credentials are read again for every job. Jobs run one at a time, so all
+    clients of the service share a single rate budget towards Jira.
+    """
+
+    def __init__(self, socket_path: Path = DAEMON_SOCKET):
+        self.socket_path = socket_path
+        self._processors: dict[tuple, tuple[WorklogProcessor, float]] = {}
+        self._job_lock = threading.Lock()
+        # the running job and its processor, and jobs cancelled by their client
+        self._control_lock = threading.Lock()
+        self._running: tuple[str | None, WorklogProcessor] | None = None
+        self._cancelled: set[str] = set()
+
+    def _processor(
+        self,
+        profile: str,
+        timezone: str,
+        use_mirror: bool,
+        overlap_mode: str,
+        columnar: bool,
+    ) -> WorklogProcessor:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, last_used) in self._processors.items()
+            if now - last_used > DAEMON_IDLE_TTL_SEC
+        ]
+        for key in expired:
+            del self._processors[key]
+        # credentials may have been changed by the app in the meantime
+        CredentialManager.clear_cache()
+
+        key = (profile, timezone, use_mirror, overlap_mode, columnar)
+        credentials = CredentialManager.get_credentials(profile)
+        if not all(credentials):
+            raise ValueError(f"No credentials saved for Jira profile '{profile}'")
+        processor = self._processors.get(key, (None, 0.0))[0]
+        if processor is None or processor.credentials != credentials:
+            processor = WorklogProcessor(
+                credentials,
+                timezone,
+                use_mirror=use_mirror,
+                columnar=columnar,
+                overlap_mode=overlap_mode,
+            )
+        else:
+            # files on disk and worklogs in Jira may have been changed by other
+            # runs; the sessions and the mirror stay warm
+            processor.routing = RoutingRules.load()
+            processor.history.invalidate()
+            processor.refresh_clients()
+        self._processors[key] = (processor, now)
+        return processor
+
+    def control(self, op: str, job: str | None) -> bool:
+        """Pause, resume or cancel a job by its ID; False if it is not running."""
+        if job is None:
+            return False
+        with self._control_lock:
+            if op == "cancel":
+                # also stops a job still queued, or one about to start its run
+                self._cancelled.add(job)
+            running = self._running
+            if running is None or running[0] != job:
+                return False
+            getattr(running[1], op)()
+            return True
+
+    def process_file(self, request: dict, send: Callable[[dict], None]) -> None:
+        def run(processor: WorklogProcessor, callback: Callable) -> None:
+            processor.process_file(
+                Path(request["file"]),
+                request.get("provider", "auto"),
+                callback,
+                prevent_duplicates=request.get("prevent_duplicates", True),
+                skip_imported=request.get("skip_imported", True),
+                sheets=request.get("sheets"),
+            )
+
+        self._run_job(request, send, run)
+
+    def process_entries(self, request: dict, send: Callable[[dict], None]) -> None:
+        """Post entries loaded and reviewed by a client, e.g. the app."""
+
+        def run(processor: WorklogProcessor, callback: Callable) -> None:
+            entries = [entry_from_json(data) for data in request["entries"]]
+            # rows are remembered in the import history under the client's file
+            processor.provider_name = request.get("provider")
+            processor.source = request.get("source")
+            processor.duplicate_count = 0
+            processor.process_entries(
+                [e for e in entries if e.status in PROCESSABLE_STATUSES],
+                callback,
+                request.get("prevent_duplicates", True),
+            )
+
+        self._run_job(request, send, run)
+
+    def _run_job(
+        self,
+        request: dict,
+        send: Callable[[dict], None],
+        run: Callable[[WorklogProcessor, Callable], None],
+    ) -> None:
+        """Run a job once no other job runs, streaming its events to send."""
+        job = request.get("job")
+        if not self._job_lock.acquire(blocking=False):
+            send({"event": "queued"})
+            self._job_lock.acquire()
+        try:
+            try:
+                processor = self._processor(
+                    request.get("jira_profile", DEFAULT_PROFILE),
+                    request["timezone"],
+                    request.get("use_mirror", False),
+                    request.get("overlap_mode", "off"),
+                    request.get("columnar", False),
+                )
+            except (KeyError, ValueError) as e:
+                send({"event": "error", "message": str(e)})
+                return
+
+            def callback(
+                idx: int, total: int, entry: WorklogEntry, result: ProcessingResult
+            ) -> None:
+                try:
+                    send(
+                        {
+                            "event": "result",
+                            "idx": idx,
+                            "total": total,
+                            "row": entry._idx,
+                            "status": entry.status,
+                            "error": error_text(result.error),
+                            "warning": result.warning,
+                            "stats": str(processor.throughput_stats()),
+                        }
+                    )
+                except OSError:
+                    processor.cancel()
+                if job in self._cancelled:
+                    processor.cancel()
+
+            with self._control_lock:
+                cancelled = job in self._cancelled
+                self._cancelled.discard(job)
+                if not cancelled:
+                    self._running = (job, processor)
+            if cancelled:
+                send(
+                    {
+                        "event": "done",
+                        "total": 0,
+                        "counts": {},
+                        "duplicates": 0,
+                        "cancelled": True,
+                        "report": None,
+                    }
+                )
+                return
+            try:
+                run(processor, callback)
+            except Exception as e:
+                send({"event": "error", "message": str(e)})
+                return
+            finally:
+                with self._control_lock:
+                    self._running = None
+                    self._cancelled.discard(job)
+            report = processor.report
+            send(
+                {
+                    "event": "done",
+                    "total": processor.total,
+                    "counts": dict(processor.counts),
+                    "duplicates": processor.duplicate_count,
+                    "cancelled": processor.cancelled,
+                    "report": str(report.path) if report else None,
+                }
+            )
+        finally:
+            self._job_lock.release()
+
+    def serve_forever(self) -> None:
+        if not daemon_supported():
+            raise RuntimeError("The AutoLog service needs Unix socket support")
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).available():
+                raise RuntimeError(
+                    f"AutoLog service already running on {self.socket_path}"
+                )
+            self.socket_path.unlink()  # left over by a service that crashed
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = _Server(str(self.socket_path), _Handler)
+        server.service = self
+        # jobs run with the user's saved credentials, keep other users out
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"AutoLog service listening on {self.socket_path}")
+        try:
+            with server:
+                server.serve_forever()
+        finally:
+            self.socket_path.unlink(missing_ok=True)
+
+
+class DaemonClient:
+    """Submits requests to a running AutoLog service."""
+
+    def __init__(self, socket_path: Path = DAEMON_SOCKET):
+        self.socket_path = socket_path
+
+    def _connect(self, timeout: float | None = None) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def control(self, op: str, job: str) -> bool:
+        """Pause, resume or cancel a submitted job; False if it is not known."""
+        return next(self.request({"op": op, "job": job}, timeout=5.0))["found"]
+
+    def available(self) -> bool:
+        """Whether a service answers on the socket."""
+        if not daemon_supported() or not self.socket_path.exists():
+            return False
+        try:
+            return next(self.request({"op": "ping"}, timeout=1.0))["event"] == "pong"
+        except (OSError, ValueError, StopIteration):
+            return False
+
+    def request(self, message: dict, timeout: float | None = None) -> Iterator[dict]:
+        """Send a request and yield the service's events until it is done."""
+        with self._connect(timeout) as sock, sock.makefile("rwb") as stream:
+            stream.write(json.dumps(message).encode() + b"\n")
+            stream.flush()
+            for line in stream:
+                yield json.loads(line)
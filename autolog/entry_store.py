@@ -0,0 +1,224 @@
+"""Columnar in-memory storage for large sets of worklog entries"""
+
+from array import array
+from datetime import datetime
+from typing import Iterable, Iterator
+
+import numpy as np
+import pytz
+
+from autolog.constants import STATUS_DISPLAY
+from autolog.models import WorklogEntry
+
+STATUSES: list[str] = list(STATUS_DISPLAY)
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+class EntryView:
+    """
+    A lightweight row of an EntryStore that behaves like a WorklogEntry.
+
+    Reads and writes go straight to the store's columns.
+    """
+
+    __slots__ = ("_store", "_idx")
+
+    def __init__(self, store: "EntryStore", idx: int):
+        self._store = store
+        self._idx = idx
+
+    @property
+    def started(self) -> datetime:
+        return datetime.fromtimestamp(self._store._started[self._idx], self._store.tz)
+
+    @started.setter
+    def started(self, value: datetime) -> None:
+        self._store._started[self._idx] = self._store._epoch(value)
+
+    @property
+    def duration(self) -> int:
+        return self._store._duration[self._idx]
+
+    @duration.setter
+    def duration(self, value: int) -> None:
+        self._store._duration[self._idx] = value
+
+    @property
+    def status(self) -> str:
+        return STATUSES[self._store._status[self._idx]]
+
+    @status.setter
+    def status(self, value: str) -> None:
+        self._store._status[self._idx] = _STATUS_CODES[value]
+
+    @property
+    def issue_key(self) -> str | None:
+        return self._store._string(self._store._issue_key[self._idx])
+
+    @issue_key.setter
+    def issue_key(self, value: str | None) -> None:
+        self._store._issue_key[self._idx] = self._store._code(value)
+
+    @property
+    def activity(self) -> str:
+        return self._store._string(self._store._activity[self._idx])
+
+    @property
+    def raw_issue_key(self) -> str | None:
+        return self._store._string(self._store._raw_issue_key[self._idx])
+
+    @property
+    def description(self) -> str:
+        return self._store._description[self._idx]
+
+    @property
+    def sheet(self) -> str | None:
+        return self._store._string(self._store._sheet[self._idx])
+
+    @property
+    def duplicate_of(self) -> int | None:
+        value = self._store._duplicate_of[self._idx]
+        return None if value < 0 else value
+
+    @duplicate_of.setter
+    def duplicate_of(self, value: int | None) -> None:
+        self._store._duplicate_of[self._idx] = -1 if value is None else value
+
+    @property
+    def timezone(self) -> str:
+        return self._store.timezone
+
+    def to_entry(self) -> WorklogEntry:
+        return WorklogEntry(
+            started=self.started,
+            duration=self.duration,
+            activity=self.activity,
+            description=self.description,
+            timezone=self.timezone,
+            raw_issue_key=self.raw_issue_key,
+            issue_key=self.issue_key,
+            status=self.status,
+            sheet=self.sheet,
+            duplicate_of=self.duplicate_of,
+            _idx=self._idx,
+        )
+
+    # behaviour shared with WorklogEntry
+    normalized_start_utc = WorklogEntry.normalized_start_utc
+    fingerprint = WorklogEntry.fingerprint
+    dedup_key = WorklogEntry.dedup_key
+    __eq__ = WorklogEntry.__eq__
+    __str__ = WorklogEntry.__str__
+    __hash__ = None
+
+
+class EntryStore:
+    """
+    Worklog entries kept as typed columns instead of one object per row.
+
+    Start times are stored as UTC epoch seconds, strings that repeat (activity,
+    issue keys) are pooled into integer codes and statuses are small integers,
+    so filtering, grouping and totals run vectorized over the columns.
+    """
+
+    def __init__(self, timezone: str):
+        self.timezone = timezone
+        self.tz = pytz.timezone(timezone)
+        self._started = array("q")
+        self._duration = array("q")
+        self._status = array("b")
+        self._issue_key = array("i")
+        self._activity = array("i")
+        self._raw_issue_key = array("i")
+        self._sheet = array("i")
+        self._duplicate_of = array("i")
+        self._description: list[str] = []
+        self._strings: list[str] = []
+        self._string_codes: dict[str, int] = {}
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[WorklogEntry], timezone: str):
+        store = cls(timezone)
+        for entry in entries:
+            store.append(entry)
+        return store
+
+    def _code(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        code = self._string_codes.get(value)
+        if code is None:
+            code = self._string_codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def _string(self, code: int) -> str | None:
+        return None if code < 0 else self._strings[code]
+
+    def _epoch(self, started: datetime) -> int:
+        if started.tzinfo is None:
+            started = self.tz.localize(started)
+        return int(started.timestamp())
+
+    def append(self, entry: WorklogEntry) -> EntryView:
+        self._started.append(self._epoch(entry.started))
+        self._duration.append(entry.duration)
+        self._status.append(_STATUS_CODES[entry.status])
+        self._issue_key.append(self._code(entry.issue_key))
+        self._activity.append(self._code(entry.activity))
+        self._raw_issue_key.append(self._code(entry.raw_issue_key))
+        self._sheet.append(self._code(entry.sheet))
+        self._duplicate_of.append(
+            -1 if entry.duplicate_of is None else entry.duplicate_of
+        )
+        self._description.append(entry.description or "")
+        return EntryView(self, len(self._duration) - 1)
+
+    def __len__(self) -> int:
+        return len(self._duration)
+
+    def __getitem__(self, idx: int) -> EntryView:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("entry index out of range")
+        return EntryView(self, idx)
+
+    def __iter__(self) -> Iterator[EntryView]:
+        return (EntryView(self, idx) for idx in range(len(self)))
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a numpy copy of a typed column, e.g. "started" or "status"."""
+        col = getattr(self, f"_{name}")
+        # copy, so the array stays resizable once the temporary view is gone
+        return np.frombuffer(col, dtype=col.typecode).copy()
+
+    def status_mask(self, statuses: Iterable[str]) -> np.ndarray:
+        codes = [_STATUS_CODES[status] for status in statuses]
+        return np.isin(self.column("status"), codes)
+
+    def select(self, statuses: Iterable[str]) -> list[EntryView]:
+        """Rows whose status is one of the given statuses."""
+        return [
+            EntryView(self, int(i)) for i in np.flatnonzero(self.status_mask(statuses))
+        ]
+
+    def total_duration(self, statuses: Iterable[str] | None = None) -> int:
+        durations = self.column("duration")
+        if statuses is not None:
+            durations = durations[self.status_mask(statuses)]
+        return int(durations.sum())
+
+    def status_counts(self) -> dict[str, int]:
+        counts = np.bincount(self.column("status"), minlength=len(STATUSES))
+        return {status: int(counts[code]) for code, status in enumerate(STATUSES)}
+
+    def duration_by_issue(self) -> dict[str | None, int]:
+        """Total seconds per issue key, None collecting rows without a key."""
+        codes = self.column("issue_key")
+        unique, inverse = np.unique(codes, return_inverse=True)
+        totals = np.bincount(inverse, weights=self.column("duration"))
+        return {
+            self._string(int(code)): int(total)
+            for code, total in zip(unique, totals, strict=True)
+        }
@@ -1,2 +1,21 @@
 class DuplicateWorklogError(Exception):
     pass
+
+
+class ParserError(Exception):
+    pass
+
+
+class OverlappingWorklogError(Exception):
+    pass
+
+
+class LoadCancelledError(Exception):
+    pass
+
+
+def error_text(error: Exception | None) -> str | None:
+    """An error's message, the response text for Jira errors; None if no error."""
+    if error is None:
+        return None
+    return str(getattr(error, "text", None) or error)
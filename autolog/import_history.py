@@ -0,0 +1,94 @@
+"""Tracks rows already imported per (provider, source)"""
+
+import json
+import logging
+from pathlib import Path
+
+from autolog.constants import DATA_DIR
+from autolog.models import WorklogEntry
+
+IMPORT_HISTORY_FILE = DATA_DIR / "import_history.json"
+
+logger = logging.getLogger(__name__)
+
+
+class ImportHistory:
+    """
+    Remembers a content hash for every row posted from a (provider, source).
+
+    On the next load of the same source, rows are classified as new, changed
+    or unchanged so that only new and changed rows are sent to Jira.
+    """
+
+    def __init__(self, path: Path = IMPORT_HISTORY_FILE):
+        self.path = path
+        self._data: dict[str, dict[str, str]] | None = None
+
+    @staticmethod
+    def source_key(provider: str, source: str) -> str:
+        return f"{provider.lower()}::{source}"
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        if self._data is None:
+            try:
+                self._data = json.loads(self.path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable import history: {e}")
+                self._data = {}
+        return self._data
+
+    def invalidate(self) -> None:
+        """Drop the loaded history so it is read from disk again."""
+        self._data = None
+
+    def classify(
+        self, provider: str, source: str, entries: list[WorklogEntry]
+    ) -> dict[str, int]:
+        """
+        Mark entries already imported with identical content as "unchanged".
+
+        Returns the count of new, changed and unchanged rows.
+        """
+        counts = {"new": 0, "changed": 0, "unchanged": 0}
+        for entry in entries:
+            counts[self.classify_entry(provider, source, entry)] += 1
+        return counts
+
+    def classify_entry(self, provider: str, source: str, entry: WorklogEntry) -> str:
+        """Classify a single entry as "new", "changed" or "unchanged"."""
+        known = self._load().get(self.source_key(provider, source), {})
+        row_key, content_hash = entry.fingerprint()
+        previous = known.get(row_key)
+        if previous is None:
+            return "new"
+        if previous == content_hash:
+            entry.status = "unchanged"
+            return "unchanged"
+        return "changed"
+
+    def record(self, provider: str, source: str, entries: list[WorklogEntry]) -> None:
+        """Remember the current content of every entry now present in Jira."""
+        key = self.source_key(provider, source)
+        known = self._load().setdefault(key, {})
+        for entry in entries:
+            if entry.status in ("success", "skipped"):
+                row_key, content_hash = entry.fingerprint()
+                known[row_key] = content_hash
+
+    def forget(self, entries: list[WorklogEntry]) -> None:
+        """Forget entries whose worklogs were deleted, in every source."""
+        fingerprints = [entry.fingerprint() for entry in entries]
+        for known in self._load().values():
+            for row_key, content_hash in fingerprints:
+                if known.get(row_key) == content_hash:
+                    del known[row_key]
+
+    def save(self) -> None:
+        if self._data is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._data), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -0,0 +1,57 @@
+"""Sorted interval index for overlap queries"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, NamedTuple
+
+
+class Interval(NamedTuple):
+    start: float
+    end: float
+    label: Any = None
+
+
+class IntervalIndex:
+    """
+    Intervals kept sorted by start time.
+
+    A query only looks at intervals starting between ``start - longest`` and
+    ``end``, found by bisection, so it costs O(log n) plus the few candidates
+    in that window.
+    """
+
+    def __init__(self):
+        self._starts: list[float] = []
+        self._intervals: list[Interval] = []
+        self._longest = 0.0
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, start: float, end: float, label: Any = None) -> None:
+        idx = bisect_right(self._starts, start)
+        self._starts.insert(idx, start)
+        self._intervals.insert(idx, Interval(start, end, label))
+        self._longest = max(self._longest, end - start)
+
+    def remove(self, start: float, label: Any = None) -> bool:
+        """Remove one interval with this start and label, if present."""
+        idx = bisect_left(self._starts, start)
+        while idx < len(self._starts) and self._starts[idx] == start:
+            if self._intervals[idx].label == label:
+                del self._starts[idx]
+                del self._intervals[idx]
+                return True
+            idx += 1
+        return False
+
+    def overlapping(
+        self, start: float, end: float, tolerance: float = 0
+    ) -> list[Interval]:
+        """Intervals sharing more than `tolerance` seconds with [start, end)."""
+        lo = bisect_left(self._starts, start - self._longest)
+        hi = bisect_left(self._starts, end - tolerance)
+        return [
+            interval
+            for interval in self._intervals[lo:hi]
+            if min(end, interval.end) - max(start, interval.start) > tolerance
+        ]
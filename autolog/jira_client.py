@@ -1,29 +1,71 @@
 """Jira API interaction"""
 
 import logging
+import math
+import threading
+from datetime import datetime
 
 import pytz
 from dateutil import parser
 from jira import JIRA, JIRAError
 
-from autolog.exceptions import DuplicateWorklogError
+from autolog.constants import (
+    OVERLAP_FETCH_DAYS,
+    OVERLAP_SCOPE,
+    OVERLAP_TOLERANCE_SEC,
+)
+from autolog.exceptions import DuplicateWorklogError, OverlappingWorklogError
+from autolog.interval_index import IntervalIndex
 from autolog.models import ProcessingResult, WorklogEntry
+from autolog.retry import TRANSIENT_ERRORS, Cooldown
+from autolog.worklog_mirror import WorklogMirror
 
 JIRA_TIMEOUT = 30
+DAY_SEC = 86400
 
 logger = logging.getLogger(__file__)
 
 
 class JiraClient:
     def __init__(
-        self, base_url: str, email: str, api_key: str, prevent_duplicates: bool = True
+        self,
+        base_url: str,
+        email: str,
+        api_key: str,
+        prevent_duplicates: bool = True,
+        use_mirror: bool = False,
+        overlap_mode: str = "off",
+        overlap_tolerance: float = OVERLAP_TOLERANCE_SEC,
     ):
         self.base_url = base_url
         self.email = email
         self.api_key = api_key
         self.client: JIRA | None = None
         self.prevent_duplicates = prevent_duplicates
+        self.use_mirror = use_mirror
+        self.mirror: WorklogMirror | None = None
+        self._mirror_synced = False
+        self._mirrored_keys: set[str] = set()
         self.worklog_cache = {}
+        # "off", "flag" (log and post anyway) or "skip"
+        self.overlap_mode = overlap_mode
+        self.overlap_tolerance = overlap_tolerance
+        self._myself: dict | None = None
+        self._indexed_ids: set[str] = set()
+        self._user_intervals = IntervalIndex()
+        self._issue_intervals: dict[str, IntervalIndex] = {}
+        # epoch range whose own worklogs on any issue are indexed
+        self._user_window: tuple[float, float] | None = None
+        # guards the cache and indexes, changed by preload, post and delete
+        # threads alike; network calls are made outside of it
+        self._cache_lock = threading.RLock()
+        # paces the requests of every worker posting to this site
+        self.cooldown = Cooldown()
+
+    @property
+    def tracks_worklogs(self) -> bool:
+        """Whether existing worklogs are needed, to find duplicates or overlaps"""
+        return self.prevent_duplicates or self.overlap_mode != "off"
 
     def connect(self):
         self.client = JIRA(
@@ -31,9 +73,31 @@ class JiraClient:
             basic_auth=(self.email, self.api_key),
             timeout=JIRA_TIMEOUT,
             async_=True,
+            # RetryPolicy is the only retry layer, so cancel and pause can
+            # interrupt backoff and retried posts get the duplicate check
+            max_retries=0,
         )
+        if self.use_mirror:
+            self.mirror = WorklogMirror(
+                self.client, self.base_url, self.email, self.api_key, JIRA_TIMEOUT
+            )
         return self.client
 
+    def invalidate_worklogs(self) -> None:
+        """Forget cached worklogs, which may be outdated when a client is reused
+
+        A mirror keeps its data and only syncs the changes since its last sync
+        on the next preload.
+        """
+        with self._cache_lock:
+            self.worklog_cache = {}
+            self._mirror_synced = False
+            self._mirrored_keys.clear()
+            self._indexed_ids = set()
+            self._user_intervals = IntervalIndex()
+            self._issue_intervals = {}
+            self._user_window = None
+
     def _convert_jira_worklog(self, worklog) -> WorklogEntry:
         """Convert JIRA worklog to our model with UTC timezone"""
         started = parser.parse(worklog.started)
@@ -47,17 +111,190 @@ class JiraClient:
             timezone="UTC",  # Jira times are always UTC
         )
 
-    def preload_worklogs(self, issue_keys: list[str]) -> None:
-        """Prefetch worklogs only if duplicate prevention is enabled"""
-        if not self.prevent_duplicates:
+    def preload_worklogs(
+        self,
+        issue_keys: list[str],
+        cancel_event: threading.Event | None = None,
+        oldest: datetime | None = None,
+    ) -> None:
+        """Prefetch worklogs only if duplicates or overlaps are checked
+
+        oldest is the earliest start of the entries the worklogs are checked
+        against, bounding how far back the mirror is synced.
+        """
+        if not self.tracks_worklogs:
             return
 
+        if self.mirror is not None:
+            self._preload_from_mirror(issue_keys, oldest)
+        self._fetch_worklogs(issue_keys, cancel_event)
+
+    def _preload_from_mirror(
+        self, issue_keys: list[str], oldest: datetime | None
+    ) -> None:
+        """Fill the cache from the synced mirror instead of per-issue requests"""
+        try:
+            if not self._mirror_synced or not self.mirror.covers(oldest):
+                self.mirror.sync(oldest)
+                self._mirror_synced = True
+                # the mirror now reaches further back than what was cached
+                with self._cache_lock:
+                    for key in self._mirrored_keys:
+                        self.worklog_cache.pop(key, None)
+                    self._mirrored_keys.clear()
+            with self._cache_lock:
+                missing = [key for key in issue_keys if key not in self.worklog_cache]
+                for key, worklogs in self.mirror.worklogs_by_key(missing).items():
+                    self._cache_worklogs(key, worklogs)
+                    self._mirrored_keys.add(key)
+        except (JIRAError, *TRANSIENT_ERRORS) as e:
+            logger.warning(f"Worklog mirror sync failed, fetching per issue: {e}")
+
+    def _fetch_worklogs(
+        self, issue_keys: list[str], cancel_event: threading.Event | None = None
+    ) -> None:
         for key in issue_keys:
+            if cancel_event is not None and cancel_event.is_set():
+                return
             if key not in self.worklog_cache:
                 try:
-                    self.worklog_cache[key] = self.client.worklogs(key)
-                except JIRAError:
-                    self.worklog_cache[key] = []
+                    worklogs = self.client.worklogs(key)
+                except (JIRAError, *TRANSIENT_ERRORS):
+                    worklogs = []
+                self._cache_new(key, worklogs)
+
+    def _cache_new(self, issue_key: str, worklogs: list) -> None:
+        """Cache fetched worklogs unless another thread cached the issue meanwhile"""
+        with self._cache_lock:
+            if issue_key not in self.worklog_cache:
+                self._cache_worklogs(issue_key, worklogs)
+
+    def _is_own(self, worklog) -> bool:
+        """Whether a worklog was logged by the connected user"""
+        author = getattr(worklog, "author", None)
+        if author is None:
+            return True  # mirrored worklogs are always the user's own
+        if self._myself is None:
+            try:
+                self._myself = self.client.myself()
+            except (JIRAError, *TRANSIENT_ERRORS):
+                self._myself = {"emailAddress": self.email}
+        for field in ("accountId", "key", "name", "emailAddress"):
+            if self._myself.get(field):
+                return getattr(author, field, None) == self._myself[field]
+        return False
+
+    def _cache_worklogs(self, issue_key: str, worklogs: list) -> None:
+        """Add worklogs to the cache and the user's own ones to the overlap index"""
+        with self._cache_lock:
+            self.worklog_cache.setdefault(issue_key, []).extend(worklogs)
+            if self.overlap_mode == "off":
+                return
+            for worklog in worklogs:
+                worklog_id = str(getattr(worklog, "id", id(worklog)))
+                if worklog_id in self._indexed_ids or not self._is_own(worklog):
+                    continue
+                self._indexed_ids.add(worklog_id)
+                start = parser.parse(worklog.started).timestamp()
+                end = start + worklog.timeSpentSeconds
+                label = f"{issue_key} {worklog.started}"
+                self._user_intervals.add(start, end, label)
+                self._issue_intervals.setdefault(issue_key, IntervalIndex()).add(
+                    start, end, label
+                )
+
+    def _forget_worklog(self, issue_key: str, worklog_id: str) -> None:
+        """Drop a deleted worklog from the cache and the overlap index"""
+        with self._cache_lock:
+            cached = self.worklog_cache.get(issue_key, [])
+            for worklog in cached:
+                if str(getattr(worklog, "id", "")) != worklog_id:
+                    continue
+                cached.remove(worklog)
+                if worklog_id in self._indexed_ids:
+                    self._indexed_ids.discard(worklog_id)
+                    start = parser.parse(worklog.started).timestamp()
+                    label = f"{issue_key} {worklog.started}"
+                    self._user_intervals.remove(start, label)
+                    self._issue_intervals[issue_key].remove(start, label)
+                return
+
+    def _cover_user_worklogs(self, start: float, end: float) -> None:
+        """Index the user's worklogs on any issue from start to end
+
+        Preloading only covers the issues of the loaded file, so issues the
+        user logged time on in the range are searched for. The covered range
+        grows by whole days, at least OVERLAP_FETCH_DAYS at a time.
+        """
+        with self._cache_lock:
+            window = self._user_window
+            if window is not None and window[0] <= start and end <= window[1]:
+                return
+            span = OVERLAP_FETCH_DAYS * DAY_SEC
+            lo = math.floor(start / DAY_SEC) * DAY_SEC
+            hi = math.ceil(end / DAY_SEC) * DAY_SEC
+            if window is None:
+                hi = max(hi, lo + span)
+                ranges = [(lo, hi)]
+            else:
+                ranges = []
+                if lo < window[0]:
+                    lo = min(lo, window[0] - span)
+                    ranges.append((lo, window[0]))
+                else:
+                    lo = window[0]
+                if hi > window[1]:
+                    hi = max(hi, window[1] + span)
+                    ranges.append((window[1], hi))
+                else:
+                    hi = window[1]
+            # set first, so a failing search is not repeated for every entry
+            self._user_window = (lo, hi)
+        for range_start, range_end in ranges:
+            self._fetch_user_worklogs(range_start, range_end)
+
+    def _fetch_user_worklogs(self, start: float, end: float) -> None:
+        # worklogDate is in the user's Jira timezone, so search a day around
+        first = datetime.fromtimestamp(start - DAY_SEC, pytz.UTC).date()
+        last = datetime.fromtimestamp(end + DAY_SEC, pytz.UTC).date()
+        jql = (
+            f'worklogAuthor = currentUser() AND worklogDate >= "{first}" '
+            f'AND worklogDate <= "{last}"'
+        )
+        try:
+            issues = self.client.search_issues(
+                jql, fields="key", maxResults=False, validate_query=False
+            )
+            for issue in issues:
+                if issue.key not in self.worklog_cache:
+                    self._cache_new(issue.key, self.client.worklogs(issue.key))
+        except (JIRAError, *TRANSIENT_ERRORS) as e:
+            logger.warning(f"Could not fetch own worklogs to check overlaps: {e}")
+
+    def _find_overlap(self, entry: WorklogEntry):
+        """Return an existing interval of the user overlapping the entry, if any"""
+        if self.overlap_mode == "off":
+            return None
+        start = entry.normalized_start_utc().timestamp()
+        if OVERLAP_SCOPE == "issue":
+            index = self._issue_intervals.get(entry.issue_key)
+        else:
+            self._cover_user_worklogs(start, start + entry.duration)
+            index = self._user_intervals
+        if not index:
+            return None
+        with self._cache_lock:
+            overlaps = index.overlapping(
+                start, start + entry.duration, self.overlap_tolerance
+            )
+        return overlaps[0] if overlaps else None
+
+    def refresh_worklogs(self, issue_key: str) -> None:
+        """Re-read an issue's worklogs, e.g. after a request of unknown outcome"""
+        if self.tracks_worklogs:
+            with self._cache_lock:
+                self.worklog_cache.pop(issue_key, None)
+            self._fetch_worklogs([issue_key])
 
     def create_worklog(self, entry: WorklogEntry) -> ProcessingResult:
         if not entry.issue_key:
@@ -65,12 +302,15 @@ class JiraClient:
 
         try:
             if self.prevent_duplicates:
-                cached = self.worklog_cache.get(entry.issue_key, [])
+                with self._cache_lock:
+                    cached = list(self.worklog_cache.get(entry.issue_key, []))
                 for jira_worklog in cached:
                     cached_entry = self._convert_jira_worklog(jira_worklog)
                     if entry == cached_entry:
-                        logging.warn(
-                            f"Duplicate worklog:{entry} conflicts with {cached_entry}"
+                        logger.warning(
+                            "Duplicate worklog: %s conflicts with %s",
+                            entry,
+                            cached_entry,
                         )
                         return ProcessingResult(
                             False,
@@ -78,6 +318,17 @@ class JiraClient:
                             DuplicateWorklogError("Duplicate worklog entry detected"),
                         )
 
+            warning = None
+            overlap = self._find_overlap(entry)
+            if overlap is not None:
+                message = f"Overlaps existing worklog {overlap.label}"
+                if self.overlap_mode == "skip":
+                    return ProcessingResult(
+                        False, entry, OverlappingWorklogError(message)
+                    )
+                logger.warning("Overlapping worklog: %s. %s", entry, message)
+                warning = message
+
             new_worklog = self.client.add_worklog(
                 issue=entry.issue_key,
                 timeSpentSeconds=entry.duration,
@@ -89,12 +340,20 @@ class JiraClient:
                 comment=entry.description,
             )
 
-            if self.prevent_duplicates:
-                if entry.issue_key in self.worklog_cache:
-                    self.worklog_cache[entry.issue_key].append(new_worklog)
-                else:
-                    self.worklog_cache[entry.issue_key] = [new_worklog]
+            if self.tracks_worklogs:
+                self._cache_worklogs(entry.issue_key, [new_worklog])
 
-            return ProcessingResult(True, entry)
-        except JIRAError as e:
+            return ProcessingResult(
+                True, entry, worklog_id=str(new_worklog.id), warning=warning
+            )
+        except (JIRAError, *TRANSIENT_ERRORS) as e:
             return ProcessingResult(False, entry, e)
+
+    def delete_worklog(self, entry: WorklogEntry, worklog_id: str) -> ProcessingResult:
+        """Delete a worklog posted for an entry, e.g. to undo a run"""
+        try:
+            self.client.worklog(entry.issue_key, worklog_id).delete()
+        except (JIRAError, *TRANSIENT_ERRORS) as e:
+            return ProcessingResult(False, entry, e, worklog_id=worklog_id)
+        self._forget_worklog(entry.issue_key, worklog_id)
+        return ProcessingResult(True, entry, worklog_id=worklog_id)
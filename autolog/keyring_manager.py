@@ -1,20 +1,94 @@
 """Handles secure credential storage"""
 
+import json
+import threading
+
 import keyring
 
+DEFAULT_PROFILE = "default"
+
+_FIELDS = ("base_url", "email", "api_key")
+
 
 class CredentialManager:
+    """
+    Stores each profile's credentials as one serialized keyring record.
+
+    Records are cached for the session and only written when they change, so
+    a typical session costs a single keyring round-trip per profile.
+    """
+
     SERVICE_NAME = "jira_worklog_app"
 
+    _cache: dict[str, tuple] = {}
+    _profiles: list[str] | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _legacy_username(cls, profile, field):
+        # one entry per field, as written by earlier versions
+        return field if profile == DEFAULT_PROFILE else f"{profile}/{field}"
+
+    @classmethod
+    def _load_legacy(cls, profile):
+        return tuple(
+            keyring.get_password(cls.SERVICE_NAME, cls._legacy_username(profile, f))
+            for f in _FIELDS
+        )
+
+    @classmethod
+    def _write(cls, profile, credentials):
+        record = json.dumps(dict(zip(_FIELDS, credentials, strict=True)))
+        keyring.set_password(cls.SERVICE_NAME, f"profile:{profile}", record)
+        cls._cache[profile] = credentials
+
+    @classmethod
+    def save_credentials(cls, base_url, email, api_key, profile=DEFAULT_PROFILE):
+        credentials = (base_url, email, api_key)
+        if cls.get_credentials(profile) == credentials:
+            return
+        with cls._lock:
+            cls._write(profile, credentials)
+            profiles = cls._get_profiles()
+            if profile not in profiles:
+                profiles.append(profile)
+                keyring.set_password(cls.SERVICE_NAME, "profiles", json.dumps(profiles))
+
+    @classmethod
+    def get_credentials(cls, profile=DEFAULT_PROFILE):
+        with cls._lock:
+            if profile in cls._cache:
+                return cls._cache[profile]
+            stored = keyring.get_password(cls.SERVICE_NAME, f"profile:{profile}")
+            if stored:
+                record = json.loads(stored)
+                credentials = tuple(record.get(f) for f in _FIELDS)
+                cls._cache[profile] = credentials
+            else:
+                credentials = cls._load_legacy(profile)
+                if any(credentials):
+                    cls._write(profile, credentials)
+                else:
+                    cls._cache[profile] = credentials
+            return credentials
+
+    @classmethod
+    def _get_profiles(cls):
+        if cls._profiles is None:
+            stored = keyring.get_password(cls.SERVICE_NAME, "profiles")
+            cls._profiles = json.loads(stored) if stored else []
+            if DEFAULT_PROFILE not in cls._profiles:
+                cls._profiles.insert(0, DEFAULT_PROFILE)
+        return cls._profiles
+
     @classmethod
-    def save_credentials(cls, base_url, email, api_key):
-        keyring.set_password(cls.SERVICE_NAME, "base_url", base_url)
-        keyring.set_password(cls.SERVICE_NAME, "email", email)
-        keyring.set_password(cls.SERVICE_NAME, "api_key", api_key)
+    def get_profiles(cls):
+        with cls._lock:
+            return list(cls._get_profiles())
 
     @classmethod
-    def get_credentials(cls):
-        base_url = keyring.get_password(cls.SERVICE_NAME, "base_url")
-        email = keyring.get_password(cls.SERVICE_NAME, "email")
-        api_key = keyring.get_password(cls.SERVICE_NAME, "api_key")
-        return base_url, email, api_key
+    def clear_cache(cls):
+        """Forget cached records, e.g. in a long-running process"""
+        with cls._lock:
+            cls._cache.clear()
+            cls._profiles = None
@@ -1,10 +1,93 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 LOGGING_FILE = Path.home() / os.environ.get("LOG_FILE", ".autolog.log")
 
+LOG_QUEUE_SIZE = 10000
+LOG_RATE_LIMIT_BURST = 5
+LOG_RATE_LIMIT_INTERVAL = 10.0
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            summary = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": f"Dropped {self.dropped} log records (queue full)",
+                }
+            )
+            try:
+                self.queue.put_nowait(summary)
+                self.dropped = 0
+            except queue.Full:
+                pass
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most `burst` records per message template every `interval`
+    seconds; the next record let through reports how many were suppressed.
+    """
+
+    def __init__(
+        self,
+        burst: int = LOG_RATE_LIMIT_BURST,
+        interval: float = LOG_RATE_LIMIT_INTERVAL,
+    ):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        # (logger, level, template) -> [window start, count, suppressed]
+        self._windows: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} [{suppressed} similar suppressed]"
+                return True
+            if window[1] < self.burst:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+    def report_suppressed(self) -> None:
+        """Log the suppression counts of windows that never reopened."""
+        with self._lock:
+            pending = [(key, w[2]) for key, w in self._windows.items() if w[2]]
+            self._windows.clear()
+        for (name, _, template), suppressed in pending:
+            logging.getLogger(name).info(
+                "%d similar messages suppressed: %s", suppressed, template
+            )
+
 
 def setup_logging():
     """
@@ -17,6 +100,10 @@ def setup_logging():
       specified by LOG_FILE environment variable,
       or 'application.log' by default, with level INFO.
 
+    Both handlers run on a background QueueListener fed through a bounded
+    queue, so logging calls never wait on disk. Repetitive messages are
+    rate-limited before they are queued.
+
     The console handler is only added
     if CONSOLE_LOGGING environment variable is 'True' (default).
     """
@@ -34,7 +121,6 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     console_handler.setLevel(log_level)
-    logger.addHandler(console_handler)
 
     # File handler
     log_file = LOGGING_FILE
@@ -43,4 +129,20 @@ def setup_logging():
     )  # 10MB per file, keep 1 backup
     file_handler.setFormatter(formatter)
     file_handler.setLevel(log_level)
-    logger.addHandler(file_handler)
+
+    # Queue handler: the only handler the logging call sites run
+    queue_handler = BoundedQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    rate_limit_filter = RateLimitFilter()
+    queue_handler.addFilter(rate_limit_filter)
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(
+        queue_handler.queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+    # atexit runs in reverse order: report suppressed counts, then flush
+    atexit.register(listener.stop)
+    atexit.register(rate_limit_filter.report_suppressed)
@@ -1,5 +1,6 @@
 """Data models"""
 
+import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,6 +19,8 @@ class WorklogEntry:
     raw_issue_key: str = None
     issue_key: str = None
     status: str = "pending"
+    sheet: Optional[str] = None
+    duplicate_of: Optional[int] = None
 
     _idx: int = 0
 
@@ -46,24 +49,32 @@ class WorklogEntry:
         # Convert any tz to UTC
         return dt.astimezone(pytz.UTC)
 
-    def __eq__(self, other: "WorklogEntry"):
-        self_start = self.normalized_start_utc()
-        self_start.replace(second=0, microsecond=0)
-
-        other_start = other.normalized_start_utc()
-        other_start.replace(second=0, microsecond=0)
-
-        time_match = self_start == other_start
+    def fingerprint(self) -> tuple[str, str]:
+        """
+        Return (row_key, content_hash) identifying this row across imports.
 
-        duration_match = self.duration == other.duration
+        The row key is the start time and activity, the content hash covers the
+        fields that end up in the Jira worklog.
+        """
+        start = self.normalized_start_utc().isoformat()
+        row_key = hashlib.sha1(f"{start}|{self.activity}".encode()).hexdigest()
+        content = "|".join(
+            (str(self.duration), self.issue_key or "", self.description or "")
+        )
+        return row_key, hashlib.sha1(content.encode()).hexdigest()
 
-        # Normalize comments
-        def clean_text(text: str) -> str:
-            return re.sub(r"\s+", " ", text.strip().lower())
+    def dedup_key(self) -> tuple:
+        """
+        Normalized (start minute in UTC, duration, comment) used for equality.
 
-        comment_match = clean_text(self.description) == clean_text(other.description)
+        Entries with equal keys are considered the same worklog.
+        """
+        start = self.normalized_start_utc().replace(second=0, microsecond=0)
+        comment = re.sub(r"\s+", " ", (self.description or "").strip().lower())
+        return start, self.duration, comment
 
-        return time_match and comment_match and duration_match
+    def __eq__(self, other: "WorklogEntry"):
+        return self.dedup_key() == other.dedup_key()
 
 
 @dataclass
@@ -71,6 +82,10 @@ class ProcessingResult:
     success: bool
     entry: WorklogEntry
     error: Exception = None
+    worklog_id: Optional[str] = None
+    latency: Optional[float] = None
+    # posted, but worth a look, e.g. overlapping time already logged
+    warning: Optional[str] = None
 
     def __str__(self):
         return (
@@ -0,0 +1,157 @@
+"""Date/time parsing with per-file format inference"""
+
+import re
+from datetime import datetime
+from typing import NamedTuple, Sequence
+
+from dateutil import parser as date_parser
+
+# values inspected to rank the formats of a file
+INFER_SAMPLE_SIZE = 1000
+
+_FIELDS = {
+    "%Y": r"(?P<year>\d{4})",
+    "%m": r"(?P<month>\d{1,2})",
+    "%d": r"(?P<day>\d{1,2})",
+}
+# optional time of day after a space or "T"
+_TIME = (
+    r"(?:[ T](?P<hour>\d{1,2}):(?P<minute>\d{2})"
+    r"(?::(?P<second>\d{2})(?:\.(?P<fraction>\d{1,6}))?)?)?"
+)
+
+
+class DateFormat(NamedTuple):
+    name: str
+    pattern: re.Pattern
+    # "ymd", "mdy" or "dmy"
+    order: str
+    separator: str
+
+
+def _compile(name: str, order: str, separator: str) -> DateFormat:
+    regex = re.escape(name)
+    for directive, group in _FIELDS.items():
+        regex = regex.replace(re.escape(directive), group)
+    return DateFormat(name, re.compile(regex + _TIME), order, separator)
+
+
+# at equal counts, earlier formats win: month-first before day-first,
+# as dateutil reads ambiguous dates
+DATE_FORMATS = [_compile(f"%Y{sep}%m{sep}%d", "ymd", sep) for sep in "-/."] + [
+    _compile(name.format(sep=sep), order, sep)
+    for sep in "-/."
+    for name, order in (("%m{sep}%d{sep}%Y", "mdy"), ("%d{sep}%m{sep}%Y", "dmy"))
+]
+
+
+def _build(match: re.Match) -> datetime:
+    fraction = match["fraction"] or ""
+    return datetime(
+        int(match["year"]),
+        int(match["month"]),
+        int(match["day"]),
+        int(match["hour"] or 0),
+        int(match["minute"] or 0),
+        int(match["second"] or 0),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+    )
+
+
+class DateTimeParser:
+    """
+    Parses the date/time values of one file with the formats found in it.
+
+    Formats are ranked once from a sample of the values; each value is then
+    read with the first fixed format that fits, and dateutil is only used for
+    values none of them match.
+    """
+
+    def __init__(self, formats: list[DateFormat], resolved_orders: set[str]):
+        self.formats = formats
+        # separators whose day/month order the file itself settles
+        self.resolved_orders = resolved_orders
+
+    @classmethod
+    def infer(
+        cls, values: Sequence[str], sample_size: int = INFER_SAMPLE_SIZE
+    ) -> "DateTimeParser":
+        counts = dict.fromkeys(DATE_FORMATS, 0)
+        for value in values[:sample_size]:
+            value = value.strip()
+            for fmt in DATE_FORMATS:
+                if cls._read(fmt, value) is not None:
+                    counts[fmt] += 1
+        formats = sorted(
+            (fmt for fmt in DATE_FORMATS if counts[fmt]),
+            key=lambda fmt: -counts[fmt],
+        )
+        resolved = set()
+        for sep in "-/.":
+            mdy, dmy = (
+                counts[fmt]
+                for fmt in DATE_FORMATS
+                if fmt.separator == sep and fmt.order != "ymd"
+            )
+            if mdy != dmy:
+                resolved.add(sep)
+        return cls(formats, resolved)
+
+    @staticmethod
+    def _read(fmt: DateFormat, value: str) -> tuple[re.Match, datetime] | None:
+        match = fmt.pattern.fullmatch(value)
+        if match is None:
+            return None
+        try:
+            return match, _build(match)
+        except ValueError:
+            # e.g. day and month swapped past 12, or February 30th
+            return None
+
+    def _match(self, value: str) -> tuple[DateFormat, re.Match, datetime] | None:
+        for fmt in self.formats:
+            found = self._read(fmt, value)
+            if found is not None:
+                return fmt, *found
+        return None
+
+    def _match_any(self, value: str) -> tuple[DateFormat, re.Match] | None:
+        for fmt in DATE_FORMATS:
+            found = self._read(fmt, value)
+            if found is not None:
+                return fmt, found[0]
+        return None
+
+    def parse(self, value: str) -> datetime:
+        value = value.strip()
+        found = self._match(value)
+        if found is None:
+            return date_parser.parse(value)
+        return found[2]
+
+    def ambiguous(self, values: Sequence[str]) -> list[str]:
+        """Values that read as another valid date with day and month swapped."""
+        result = []
+        for value in values:
+            value = value.strip()
+            found = self._match(value)
+            if found is not None:
+                fmt, match, _ = found
+                if fmt.separator in self.resolved_orders:
+                    continue
+            else:
+                # left to dateutil, which reads them month-first whatever the
+                # file's own formats are
+                found = self._match_any(value)
+                if found is None:
+                    continue
+                fmt, match = found
+            if fmt.order == "ymd":
+                continue
+            month, day = int(match["month"]), int(match["day"])
+            if month != day and day <= 12:
+                result.append(value)
+        return result
+
+    def describe(self) -> str:
+        return ", ".join(fmt.name for fmt in self.formats) or "none"
@@ -1,11 +1,14 @@
 import logging
 from pathlib import Path
-from typing import Callable, Type
+from typing import Callable, Iterator, Type
 
-import pandas as pd
+from autolog.plugins import PluginRegistry
 
 logger = logging.getLogger(__name__)
 
+# extra column added to rows read from multi-sheet workbooks
+SHEET_COLUMN = "__sheet__"
+
 
 class FileParserBase:
 
@@ -13,30 +16,55 @@ class FileParserBase:
     _reader: Callable[[str, Type], str] = None
 
     @classmethod
-    def read(cls, file_path: Path) -> list[dict]:
-        """Return raw rows as list of dicts."""
+    def read(cls, file_path: Path, **options) -> list[dict]:
+        """Return raw rows as list of dicts.
+
+        Options are format specific; parsers ignore the ones they don't use.
+        """
         df = cls._reader(file_path, dtype=str).fillna("")
         return df.to_dict(orient="records")
 
+    @classmethod
+    def iter_read(
+        cls, file_path: Path, batch_rows: int, **options
+    ) -> Iterator[list[dict]]:
+        """Yield raw rows in batches, as read would return them.
+
+        Parsers that can read a file incrementally yield batches of about
+        batch_rows rows; the default reads the whole file as one batch.
+        """
+        yield cls.read(file_path, **options)
 
-class CSVParser(FileParserBase):
-    _reader = pd.read_csv
+    @classmethod
+    def read_header(cls, file_path: Path, nrows: int = 5, **options) -> list[str]:
+        """Return column names, reading only the first few rows."""
+        df = cls._reader(file_path, dtype=str, nrows=nrows)
+        return [str(col).strip() for col in df.columns]
+
+    @classmethod
+    def read_sample(cls, file_path: Path, nrows: int, **options) -> list[dict]:
+        """Return the first rows only, like read does for the whole file."""
+        df = cls._reader(file_path, dtype=str, nrows=nrows).fillna("")
+        return df.to_dict(orient="records")
 
 
-class ExcelParser(FileParserBase):
-    _reader = pd.read_excel
+# parsers registry, keyed by file suffix; modules are imported when selected
+_parsers = PluginRegistry(
+    "autolog.file_parsers",
+    {
+        ".csv": "autolog.parsers.pandas_parsers:CSVParser",
+        ".xls": "autolog.parsers.pandas_parsers:ExcelParser",
+        ".xlsx": "autolog.parsers.pandas_parsers:ExcelParser",
+    },
+)
 
 
-# parsers registry
-_parsers: dict[str, Type[FileParserBase]] = {
-    ".csv": CSVParser,
-    ".xls": ExcelParser,
-    ".xlsx": ExcelParser,
-}
+def register_file_parser(suffix: str, parser_cls: Type[FileParserBase] | str) -> None:
+    _parsers.register(suffix, parser_cls)
 
 
 def get_supported_formats() -> list[str]:
-    return list(_parsers.keys())
+    return _parsers.names()
 
 
 def select_file_parser(file_path: Path) -> FileParserBase:
@@ -0,0 +1,202 @@
+import io
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterator
+
+import openpyxl
+import pandas as pd
+
+from autolog.parsers.file_parsers import SHEET_COLUMN, FileParserBase
+
+# bytes of the file scanned at a time while looking for record boundaries
+_SCAN_BLOCK = 16 * 1024 * 1024
+# sheets are read while the app and loader threads run; forking a threaded
+# process can leave a worker holding a lock copied mid-use
+_SPAWN = multiprocessing.get_context("spawn")
+
+
+def _count_quotes(mm: mmap.mmap, start: int, end: int) -> int:
+    count = 0
+    for pos in range(start, end, _SCAN_BLOCK):
+        count += mm[pos : min(end, pos + _SCAN_BLOCK)].count(b'"')
+    return count
+
+
+def _next_record(mm: mmap.mmap, pos: int, quoted: bool) -> tuple[int, bool]:
+    """Offset after the first newline at or past pos that is outside quotes."""
+    while True:
+        newline = mm.find(b"\n", pos)
+        if newline == -1:
+            return len(mm), quoted
+        quoted ^= _count_quotes(mm, pos, newline) % 2 == 1
+        pos = newline + 1
+        if not quoted:
+            return pos, quoted
+
+
+class CSVParser(FileParserBase):
+    _reader = pd.read_csv
+
+    @classmethod
+    def iter_read(
+        cls, file_path: Path, batch_rows: int, **options
+    ) -> Iterator[list[dict]]:
+        with pd.read_csv(file_path, dtype=str, chunksize=batch_rows) as chunks:
+            for df in chunks:
+                yield df.fillna("").to_dict(orient="records")
+
+    @classmethod
+    def split_records(cls, file_path: Path, parts: int) -> list[int]:
+        """
+        Offsets splitting the file into about `parts` ranges of whole records.
+
+        The first offset is the end of the header row. A newline only ends a
+        record when the quotes before it are balanced, so quoted fields with
+        line breaks are never cut.
+        """
+        with (
+            open(file_path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            size = len(mm)
+            pos, quoted = _next_record(mm, 0, False)
+            bounds = [pos]
+            for part in range(1, parts):
+                target = bounds[0] + (size - bounds[0]) * part // parts
+                if target <= pos:
+                    continue
+                quoted ^= _count_quotes(mm, pos, target) % 2 == 1
+                pos, quoted = _next_record(mm, target, quoted)
+                if pos >= size:
+                    break
+                bounds.append(pos)
+            if bounds[-1] < size:
+                bounds.append(size)
+            return bounds
+
+    @classmethod
+    def read_range(
+        cls, file_path: Path, header_end: int, start: int, end: int
+    ) -> list[dict]:
+        """Read the records between two offsets given by split_records."""
+        with (
+            open(file_path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            data = mm[:header_end] + mm[start:end]
+        df = pd.read_csv(io.BytesIO(data), dtype=str).fillna("")
+        return df.to_dict(orient="records")
+
+
+def _read_sheet(file_path: Path, sheet: str) -> list[dict]:
+    """Read one worksheet; module level so it can run in a worker process."""
+    df = pd.read_excel(file_path, sheet_name=sheet, dtype=str).fillna("")
+    df[SHEET_COLUMN] = sheet
+    return df.to_dict(orient="records")
+
+
+def _cell_text(value) -> str:
+    """A cell value as read_excel with dtype=str reads it, blank cells as ""."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _iter_sheet(file_path: Path, sheet: str, batch_rows: int) -> Iterator[list[dict]]:
+    """Read one .xlsx worksheet row by row, without loading it whole."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [
+            f"Unnamed: {i}" if col is None else str(col) for i, col in enumerate(header)
+        ]
+        batch = []
+        for values in rows:
+            if all(value is None for value in values):
+                continue
+            row = {
+                col: _cell_text(value)
+                for col, value in zip(columns, values, strict=False)
+            }
+            row[SHEET_COLUMN] = sheet
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        workbook.close()
+
+
+class ExcelParser(FileParserBase):
+    _reader = pd.read_excel
+
+    @classmethod
+    def sheet_names(cls, file_path: Path, sheets: list[str] | None = None) -> list[str]:
+        """Workbook sheets matching any of the given names or glob patterns."""
+        with pd.ExcelFile(file_path) as workbook:
+            names = [str(name) for name in workbook.sheet_names]
+        if not sheets:
+            return names
+        selected = [n for n in names if any(fnmatchcase(n, p) for p in sheets)]
+        if not selected:
+            raise ValueError(
+                f"No sheet matches {', '.join(sheets)}. Available: {', '.join(names)}"
+            )
+        return selected
+
+    @classmethod
+    def read(cls, file_path: Path, sheets: list[str] | None = None, **options):
+        """Read every selected sheet, in parallel worker processes if several."""
+        names = cls.sheet_names(file_path, sheets)
+        if len(names) == 1:
+            return _read_sheet(file_path, names[0])
+        workers = min(len(names), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_SPAWN) as pool:
+            chunks = pool.map(_read_sheet, [file_path] * len(names), names)
+            return [row for chunk in chunks for row in chunk]
+
+    @classmethod
+    def iter_read(
+        cls,
+        file_path: Path,
+        batch_rows: int,
+        sheets: list[str] | None = None,
+        **options,
+    ) -> Iterator[list[dict]]:
+        """Stream a single .xlsx sheet; yield several sheets as each is read."""
+        names = cls.sheet_names(file_path, sheets)
+        if len(names) > 1:
+            workers = min(len(names), os.cpu_count() or 1)
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=_SPAWN)
+            try:
+                yield from pool.map(_read_sheet, [file_path] * len(names), names)
+            finally:
+                pool.shutdown(cancel_futures=True)
+        elif file_path.suffix.lower() == ".xlsx":
+            yield from _iter_sheet(file_path, names[0], batch_rows)
+        else:
+            # .xls workbooks are only readable whole
+            yield _read_sheet(file_path, names[0])
+
+    @classmethod
+    def read_header(
+        cls,
+        file_path: Path,
+        nrows: int = 5,
+        sheets: list[str] | None = None,
+        **options,
+    ) -> list[str]:
+        sheet = cls.sheet_names(file_path, sheets)[0] if sheets else 0
+        df = pd.read_excel(file_path, sheet_name=sheet, dtype=str, nrows=nrows)
+        return [str(col).strip() for col in df.columns]
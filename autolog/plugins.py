@@ -0,0 +1,57 @@
+"""Lazily loaded plugin registries"""
+
+import importlib
+import logging
+from importlib.metadata import entry_points
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class PluginRegistry:
+    """
+    Maps names to ``"module:attr"`` targets that are imported on first use.
+
+    Built-in targets are given up front; third-party packages add more through
+    the registry's entry-point group or at runtime with :meth:`register`.
+    """
+
+    def __init__(self, group: str, builtins: dict[str, str]):
+        self.group = group
+        self._targets: dict[str, Any] = dict(builtins)
+        self._loaded: dict[str, Any] = {}
+        self._discovered = False
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        self._discovered = True
+        for ep in entry_points(group=self.group):
+            # entry points are only recorded here, their modules load in get()
+            self._targets.setdefault(ep.name.lower(), ep)
+
+    def register(self, name: str, target: Any) -> None:
+        """Register a class or a ``"module:attr"`` string under a name."""
+        name = name.lower()
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+    def names(self) -> list[str]:
+        self._discover()
+        return list(self._targets)
+
+    def get(self, name: str) -> Any | None:
+        self._discover()
+        name = name.lower()
+        if name in self._loaded:
+            return self._loaded[name]
+        target = self._targets.get(name)
+        if target is None:
+            return None
+        if isinstance(target, str):
+            module_name, _, attr = target.partition(":")
+            target = getattr(importlib.import_module(module_name), attr)
+        elif hasattr(target, "load"):
+            target = target.load()
+        self._loaded[name] = target
+        return target
@@ -0,0 +1,127 @@
+"""Opt-in profiling of load and process runs"""
+
+import cProfile
+import functools
+import logging
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from datetime import datetime
+
+from autolog.logging_config import LOGGING_FILE
+
+logger = logging.getLogger(__name__)
+
+PROFILE_TOP_ALLOCATIONS = 25
+
+# only one cProfile profiler can be active per process on recent Pythons
+_profiler_lock = threading.Lock()
+# from Python 3.12 that profiler records the calls of every thread, before
+# only those of the thread that enabled it
+_PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+# profilers of worker threads started during the profiled call, if any
+_thread_profilers: list[cProfile.Profile] | None = None
+_thread_profilers_lock = threading.Lock()
+
+
+def profiling_enabled() -> bool:
+    """Profiling is turned on with AUTOLOG_PROFILE=True or `main.py --profile`."""
+    return os.environ.get("AUTOLOG_PROFILE", "False") == "True"
+
+
+def _write_allocations(path, snapshot: tracemalloc.Snapshot, peak: int) -> None:
+    stats = snapshot.statistics("lineno")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n")
+        file.write(f"Top {PROFILE_TOP_ALLOCATIONS} allocations by line:\n")
+        for stat in stats[:PROFILE_TOP_ALLOCATIONS]:
+            file.write(f"{stat}\n")
+
+
+def profiled_thread(target):
+    """
+    Wrap a thread target so its calls end up in the profile of the profiled
+    call that starts the thread.
+
+    Needed before Python 3.12 only, where each thread has its own profiler.
+    """
+
+    @functools.wraps(target)
+    def wrapper(*args, **kwargs):
+        profilers = _thread_profilers
+        if profilers is None or _PROFILES_ALL_THREADS:
+            return target(*args, **kwargs)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return target(*args, **kwargs)
+        finally:
+            profiler.disable()
+            with _thread_profilers_lock:
+                profilers.append(profiler)
+
+    return wrapper
+
+
+def profiled(name: str):
+    """
+    Run the wrapped function under cProfile and tracemalloc when profiling is
+    enabled, writing ``autolog-<name>-<stamp>.prof`` and ``...-alloc.txt``
+    next to the log file.
+
+    cProfile covers the calling thread and threads whose target is wrapped
+    with profiled_thread; allocations are traced for the whole process.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            global _thread_profilers
+            if not profiling_enabled():
+                return func(*args, **kwargs)
+            if not _profiler_lock.acquire(blocking=False):
+                logger.info(f"Profiler busy, running {name} without profiling")
+                return func(*args, **kwargs)
+            _thread_profilers = []
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profiler.disable()
+                    with _thread_profilers_lock:
+                        stats = pstats.Stats(profiler)
+                        for thread_profiler in _thread_profilers:
+                            stats.add(thread_profiler)
+                        _thread_profilers = None
+                    snapshot = tracemalloc.take_snapshot()
+                    _, peak = tracemalloc.get_traced_memory()
+                    if started_tracing:
+                        tracemalloc.stop()
+                    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                    base = LOGGING_FILE.parent / f"autolog-{name}-{stamp}"
+                    profile_path = base.with_suffix(".prof")
+                    alloc_path = base.parent / f"{base.name}-alloc.txt"
+                    try:
+                        stats.dump_stats(profile_path)
+                        _write_allocations(alloc_path, snapshot, peak)
+                    except OSError as e:
+                        logger.error(f"Failed writing profile of {name}: {e}")
+                    else:
+                        logger.info(
+                            f"Profile of {name} written to {profile_path} "
+                            f"and {alloc_path}"
+                        )
+            finally:
+                _profiler_lock.release()
+
+        return wrapper
+
+    return decorator
@@ -1,17 +1,46 @@
+import itertools
 import logging
+import multiprocessing
+import os
 from abc import ABC
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
-from dateutil import parser as date_parser
-
+from autolog.exceptions import ParserError
 from autolog.models import WorklogEntry
-from autolog.parsers.file_parsers import select_file_parser
+from autolog.parsers.datetime_parser import INFER_SAMPLE_SIZE, DateTimeParser
+from autolog.parsers.file_parsers import SHEET_COLUMN, select_file_parser
 
 logger = logging.getLogger(__file__)
 
+# parse errors logged individually per file, the rest are only counted
+MAX_LOGGED_PARSE_ERRORS = 5
+# ambiguous dates quoted in the warning, the rest are only counted
+MAX_LOGGED_AMBIGUOUS_DATES = 5
+# files at least this large are parsed in chunks by worker processes, when
+# their parser can split them (see CSVParser.split_records)
+PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+# chunks per worker, so a slow chunk doesn't leave the other workers idle
+CHUNKS_PER_WORKER = 4
+# rows read at a time from files the parser can read incrementally
+READ_BATCH_ROWS = 5000
+
 
-class ParserError(Exception):
-    pass
+def _parse_chunk(
+    provider_cls: type["ProviderBase"],
+    file_path: Path,
+    header_end: int,
+    start: int,
+    end: int,
+    dates: DateTimeParser,
+) -> tuple[list[WorklogEntry], list[str], int, list[str]]:
+    """Parse one byte range of a file; module level so it runs in a worker."""
+    provider = provider_cls(file_path)
+    rows = provider.parser.read_range(file_path, header_end, start, end)
+    entries = list(provider._parse_rows(rows, dates))
+    ambiguous = dates.ambiguous(provider._raw_values(rows, "started"))
+    return entries, ambiguous, provider._skipped, provider._errors
 
 
 class ProviderBase(ABC):
@@ -19,25 +48,172 @@ class ProviderBase(ABC):
     field_map: dict[str, str | list[str]]
     _required_fields = ["started", "duration", "activity"]
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, **read_options):
         self.file_path = file_path
+        self.read_options = read_options
         self.parser = select_file_parser(file_path)
+        # start values that read differently with day and month swapped
+        self.ambiguous_dates: list[str] = []
+        # rows dropped on parse errors, and the first few of those errors
+        self._skipped = 0
+        self._errors: list[str] = []
+
+    @classmethod
+    def _columns(cls, attrs=None) -> set[str]:
+        columns = set()
+        for attr, cols in cls.field_map.items():
+            if attrs is None or attr in attrs:
+                columns.update(cols if isinstance(cols, (list, tuple)) else [cols])
+        return columns
+
+    @classmethod
+    def match_header(cls, header: list[str]) -> int:
+        """Score how well a header fits this provider, 0 if required ones miss."""
+        if not cls._columns(cls._required_fields) <= set(header):
+            return 0
+        return len(cls._columns() & set(header))
+
+    def validate_header(self) -> None:
+        """Fail fast on a wrong provider before reading the whole file."""
+        header = self.parser.read_header(self.file_path, **self.read_options)
+        missing = self._columns(self._required_fields) - set(header)
+        if missing:
+            raise ParserError(
+                "Invalid file: missing required "
+                f"`{', '.join(sorted(missing))}` "
+                f"column{'s' if len(missing) > 1 else ''} for this provider."
+            )
 
     def parse(self) -> list[WorklogEntry]:
-        raw_rows = self.parser.read(self.file_path)
-        entries = []
-        for row in raw_rows:
+        return list(self.iter_parse())
+
+    def _raw_values(self, rows: list[dict], attr: str) -> list[str]:
+        """The values of one field, joined like _map_fields does."""
+        cols = self.field_map[attr]
+        if isinstance(cols, (list, tuple)):
+            return [" ".join(row.get(col, "") for col in cols).strip() for row in rows]
+        return [row.get(cols, "").strip() for row in rows]
+
+    def _infer_dates(self, rows: list[dict]) -> DateTimeParser:
+        """Pick the file's date formats from its first rows."""
+        dates = DateTimeParser.infer(self._raw_values(rows, "started"))
+        logger.debug("Date formats of %s: %s", self.file_path.name, dates.describe())
+        return dates
+
+    def _add_ambiguous_dates(self, values: list[str]) -> None:
+        # warned about before their rows are yielded, as they may be posted
+        # long before the end of the file is reached
+        if values and not self.ambiguous_dates:
+            logger.warning(
+                "Dates like %s could be read day-first or month-first; "
+                "reading them month-first",
+                values[0],
+            )
+        self.ambiguous_dates.extend(values)
+
+    def _report_ambiguous_dates(self) -> None:
+        if self.ambiguous_dates:
+            examples = ", ".join(self.ambiguous_dates[:MAX_LOGGED_AMBIGUOUS_DATES])
+            logger.warning(
+                "%d dates could be read day-first or month-first (e.g. %s); "
+                "reading them month-first",
+                len(self.ambiguous_dates),
+                examples,
+            )
+
+    def _report_parse_errors(self) -> None:
+        for error in self._errors:
+            logger.warning("Skipping row due to parse error: %s", error)
+        if self._skipped:
+            logger.warning("Skipped %d rows due to parse errors", self._skipped)
+
+    def iter_parse(self) -> Iterator[WorklogEntry]:
+        """Yield entries one at a time instead of building a list."""
+        self.validate_header()
+        if self._parallel():
+            yield from self._iter_parse_parallel()
+            return
+        # batches are parsed as they are read, so a caller sees the first
+        # entries of a large file long before its last rows are read
+        batches = self.parser.iter_read(
+            self.file_path, READ_BATCH_ROWS, **self.read_options
+        )
+        # hold rows back until there are enough to infer the date formats from
+        sample: list[dict] = []
+        for raw_rows in batches:
+            sample.extend(raw_rows)
+            if len(sample) >= INFER_SAMPLE_SIZE:
+                break
+        dates = self._infer_dates(sample)
+        for raw_rows in itertools.chain([sample], batches):
+            values = self._raw_values(raw_rows, "started")
+            self._add_ambiguous_dates(dates.ambiguous(values))
+            yield from self._parse_rows(raw_rows, dates)
+        self._report_ambiguous_dates()
+        self._report_parse_errors()
+
+    def _parse_rows(
+        self, rows: list[dict], dates: DateTimeParser
+    ) -> Iterator[WorklogEntry]:
+        for row in rows:
             data = self._map_fields(row)
             data = self._post_process(data)
             try:
                 # parse date/time if needed
-                data["started"] = date_parser.parse(data["started"])
+                data["started"] = dates.parse(data["started"])
                 data["duration"] = int(data["duration"])
             except Exception as e:
-                logger.exception(f"Skipping row due to parse error: {e}")
+                self._skipped += 1
+                if len(self._errors) < MAX_LOGGED_PARSE_ERRORS:
+                    self._errors.append(str(e))
                 continue
-            entries.append(WorklogEntry(**data))
-        return entries
+            yield WorklogEntry(**data, sheet=row.get(SHEET_COLUMN))
+
+    def _parallel(self) -> bool:
+        return (
+            hasattr(self.parser, "split_records")
+            and (os.cpu_count() or 1) > 1
+            and self.file_path.stat().st_size >= PARALLEL_PARSE_MIN_BYTES
+        )
+
+    def _iter_parse_parallel(self) -> Iterator[WorklogEntry]:
+        """
+        Parse byte ranges of the file in worker processes.
+
+        Date formats are inferred from the first rows up front; chunks are
+        yielded in file order, so entries keep their original row order.
+        """
+        sample = self.parser.read_sample(self.file_path, INFER_SAMPLE_SIZE)
+        dates = DateTimeParser.infer(self._raw_values(sample, "started"))
+        workers = os.cpu_count() or 1
+        bounds = self.parser.split_records(self.file_path, workers * CHUNKS_PER_WORKER)
+        ranges = list(zip(bounds[:-1], bounds[1:], strict=True))
+        # spawned, as forking the threaded app can copy a lock held mid-use
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(ranges) or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            chunks = pool.map(
+                _parse_chunk,
+                [type(self)] * len(ranges),
+                [self.file_path] * len(ranges),
+                [bounds[0]] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+                [dates] * len(ranges),
+            )
+            for entries, ambiguous, skipped, errors in chunks:
+                self._add_ambiguous_dates(ambiguous)
+                self._skipped += skipped
+                room = MAX_LOGGED_PARSE_ERRORS - len(self._errors)
+                self._errors.extend(errors[:room])
+                yield from entries
+        finally:
+            # a load stopped early doesn't wait for the remaining chunks
+            pool.shutdown(cancel_futures=True)
+        self._report_ambiguous_dates()
+        self._report_parse_errors()
 
     def _map_fields(self, row: dict) -> dict:
         mapped = {}
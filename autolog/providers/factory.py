@@ -1,24 +1,63 @@
+import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, Type
 
-from .base import ProviderBase
-from .kimai import KimaiProvider
-from .odoo import OdooProvider
+from autolog.exceptions import ParserError
+from autolog.parsers.file_parsers import select_file_parser
+from autolog.plugins import PluginRegistry
 
-_PROVIDERS = {
-    "kimai": KimaiProvider,
-    "odoo": OdooProvider,
-}
+if TYPE_CHECKING:
+    from .base import ProviderBase
 
+logger = logging.getLogger(__name__)
 
-def select_provider(name: str, file_path: Path) -> ProviderBase:
+AUTO_PROVIDER = "auto"
+
+# providers registry; modules are imported only when a provider is selected
+_PROVIDERS = PluginRegistry(
+    "autolog.providers",
+    {
+        "kimai": "autolog.providers.kimai:KimaiProvider",
+        "odoo": "autolog.providers.odoo:OdooProvider",
+    },
+)
+
+
+def register_provider(name: str, provider_cls: "Type[ProviderBase] | str") -> None:
+    _PROVIDERS.register(name, provider_cls)
+
+
+def select_provider(name: str, file_path: Path, **read_options) -> "ProviderBase":
     name = name.lower()
     cls = _PROVIDERS.get(name)
     if not cls:
         raise ValueError(
-            f"Unknown provider '{name}'. Available: {', '.join(_PROVIDERS)}"
+            f"Unknown provider '{name}'. Available: {', '.join(_PROVIDERS.names())}"
         )
-    return cls(file_path)
+    return cls(file_path, **read_options)
 
 
 def get_providers_names() -> list[str]:
-    return list(_PROVIDERS.keys())
+    return _PROVIDERS.names()
+
+
+def detect_provider(file_path: Path) -> str:
+    """Pick the provider whose field map best matches the file's header."""
+    header = select_file_parser(file_path).read_header(file_path)
+    names = _PROVIDERS.names()
+    scores = {}
+    for name in names:
+        try:
+            provider_cls = _PROVIDERS.get(name)
+        except Exception as e:
+            # a broken third-party provider must not break detection for the rest
+            logger.warning(f"Skipping provider '{name}', it failed to load: {e}")
+            continue
+        scores[name] = provider_cls.match_header(header)
+    name, score = max(scores.items(), key=lambda item: item[1], default=(None, 0))
+    if not score:
+        raise ParserError(
+            "Could not detect the provider: the file's columns "
+            f"({', '.join(header)}) match none of: {', '.join(names)}"
+        )
+    return name
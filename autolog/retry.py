@@ -0,0 +1,104 @@
+"""Classification and backoff for transient Jira failures, and request pacing"""
+
+import random
+import threading
+import time
+
+from jira import JIRAError
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+
+from autolog.constants import (
+    COOLDOWN_EVERY,
+    COOLDOWN_SEC,
+    RETRY_BASE_SEC,
+    RETRY_BUDGET,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_SEC,
+)
+
+# errors where the request may or may not have reached Jira
+TRANSIENT_ERRORS = (Timeout, RequestsConnectionError)
+
+
+def is_retryable(error: Exception | None) -> bool:
+    """Timeouts, connection resets, 5xx and 429 are worth retrying."""
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    if isinstance(error, JIRAError):
+        status = error.status_code
+        return status is not None and (status == 429 or status >= 500)
+    return False
+
+
+def retry_after(error: Exception) -> float | None:
+    """Return the server-requested delay of a 429/503 response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Jittered exponential backoff with a retry budget shared by a whole run."""
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        budget: int = RETRY_BUDGET,
+        base_delay: float = RETRY_BASE_SEC,
+        max_delay: float = RETRY_MAX_SEC,
+    ):
+        self.max_attempts = max_attempts
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, error: Exception | None, attempt: int) -> bool:
+        """Consume one unit of budget if the failed attempt may be retried."""
+        if attempt >= self.max_attempts or not is_retryable(error):
+            return False
+        with self._lock:
+            if self.retries >= self.budget:
+                return False
+            self.retries += 1
+            return True
+
+    def delay(self, error: Exception | None, attempt: int) -> float:
+        """Seconds to wait before the given attempt number is retried."""
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(backoff / 2, backoff)
+        requested = retry_after(error) if error else None
+        return max(delay, requested) if requested else delay
+
+
+class Cooldown:
+    """A pause after every `every` requests, shared by all threads of one site."""
+
+    def __init__(self, every: int = COOLDOWN_EVERY, seconds: float = COOLDOWN_SEC):
+        self.every = every
+        self.seconds = seconds
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._resume_at = 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests = 0
+            self._resume_at = 0.0
+
+    def next_request(self) -> tuple[float, bool]:
+        """Count a request about to be sent.
+
+        Returns the seconds to wait before sending it, and whether this
+        request started a new cooldown.
+        """
+        with self._lock:
+            started = bool(self._requests) and self._requests % self.every == 0
+            if started:
+                self._resume_at = time.monotonic() + self.seconds
+            self._requests += 1
+            return self._resume_at - time.monotonic(), started
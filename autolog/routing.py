@@ -0,0 +1,53 @@
+"""Routes issue keys to named Jira profiles"""
+
+import json
+import logging
+from pathlib import Path
+
+from autolog.constants import DATA_DIR
+from autolog.models import WorklogEntry
+
+ROUTING_FILE = DATA_DIR / "routing.json"
+
+logger = logging.getLogger(__name__)
+
+
+class RoutingRules:
+    """
+    Maps issue-key project prefixes to credential profile names.
+
+    Rules are read from a JSON object such as ``{"ACME": "acme", "GLX": "globex"}``.
+    The longest matching prefix wins; unmatched keys stay on the active profile.
+    """
+
+    def __init__(self, rules: dict[str, str] | None = None):
+        self.rules = {k.upper(): v for k, v in (rules or {}).items()}
+
+    @classmethod
+    def load(cls, path: Path = ROUTING_FILE) -> "RoutingRules":
+        try:
+            rules = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            rules = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable routing rules {path}: {e}")
+            rules = {}
+        return cls(rules)
+
+    def profile_for(self, issue_key: str | None) -> str | None:
+        if not issue_key:
+            return None
+        project = issue_key.split("-", 1)[0].upper()
+        for prefix in sorted(self.rules, key=len, reverse=True):
+            if project.startswith(prefix):
+                return self.rules[prefix]
+        return None
+
+    def split(
+        self, entries: list[WorklogEntry]
+    ) -> dict[str | None, list[WorklogEntry]]:
+        """Group entries by target profile, None being the active profile."""
+        groups: dict[str | None, list[WorklogEntry]] = {}
+        for entry in entries:
+            groups.setdefault(self.profile_for(entry.issue_key), []).append(entry)
+        return groups
@@ -0,0 +1,138 @@
+"""Streams per-entry processing results to disk"""
+
+import csv
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from autolog.constants import DATA_DIR
+from autolog.exceptions import error_text
+from autolog.models import ProcessingResult, WorklogEntry
+from autolog.parsers.issue_parser import IssueKeyParser
+
+REPORTS_DIR = DATA_DIR / "reports"
+REPORT_FORMATS = ("jsonl", "csv")
+
+_REPORT_FIELDS = [
+    "row",
+    "started",
+    "duration",
+    "issue_key",
+    "activity",
+    "description",
+    "status",
+    "worklog_id",
+    "error",
+    "latency",
+    "warning",
+]
+# columns of a Kimai export, so failed rows can be loaded again as-is
+_FAILED_FIELDS = ["Date", "From", "Duration", "Activity", "Description"]
+
+
+class RunReport:
+    """
+    Writes one record per processed entry while a run is in progress.
+
+    Besides the report itself, failed rows are written to a Kimai-style CSV
+    that can be loaded back as the input of a retry run, unless failed_rows
+    is unset. kind prefixes the file names, e.g. "undo" for rollbacks.
+    """
+
+    def __init__(
+        self,
+        directory: Path = REPORTS_DIR,
+        fmt: str = "jsonl",
+        kind: str = "run",
+        failed_rows: bool = True,
+    ):
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(
+                f"Unknown report format '{fmt}'. Available: {', '.join(REPORT_FORMATS)}"
+            )
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # back-to-back runs, e.g. through the service, may start within a second
+        runs = 1
+        while (directory / f"{kind}-{stamp}.{fmt}").exists():
+            runs += 1
+            stamp = f"{stamp.split('_')[0]}_{runs}"
+        self.fmt = fmt
+        self.path = directory / f"{kind}-{stamp}.{fmt}"
+        self.failed_path = directory / f"failed-{stamp}.csv" if failed_rows else None
+        self._lock = threading.Lock()
+        self._file = open(self.path, "w", encoding="utf-8", newline="")
+        self._failed_file = None
+        self._writer = None
+        self._failed_writer = None
+        if fmt == "csv":
+            self._writer = csv.DictWriter(self._file, fieldnames=_REPORT_FIELDS)
+            self._writer.writeheader()
+
+    @staticmethod
+    def load_posted(path: Path) -> list[dict]:
+        """Records of a run report whose worklogs were posted to Jira."""
+        with open(path, encoding="utf-8", newline="") as file:
+            if path.suffix == ".csv":
+                records = list(csv.DictReader(file))
+            else:
+                records = [json.loads(line) for line in file if line.strip()]
+        return [r for r in records if r["status"] == "success" and r["worklog_id"]]
+
+    def _record(self, result: ProcessingResult) -> dict:
+        entry = result.entry
+        return {
+            "row": entry._idx,
+            "started": entry.started.isoformat(),
+            "duration": entry.duration,
+            "issue_key": entry.issue_key,
+            "activity": entry.activity,
+            "description": entry.description,
+            "status": entry.status,
+            "worklog_id": result.worklog_id,
+            "error": error_text(result.error),
+            "latency": (
+                round(result.latency, 3) if result.latency is not None else None
+            ),
+            "warning": result.warning,
+        }
+
+    def _write_failed(self, entry: WorklogEntry) -> None:
+        if self._failed_writer is None:
+            self._failed_file = open(
+                self.failed_path, "w", encoding="utf-8", newline=""
+            )
+            self._failed_writer = csv.writer(self._failed_file)
+            self._failed_writer.writerow(_FAILED_FIELDS)
+        activity = entry.activity
+        # keep an issue key fixed in the table even if the activity lacks it
+        if entry.issue_key and IssueKeyParser.parse(activity) != entry.issue_key:
+            activity = f"[{entry.issue_key}] {activity}"
+        # naive times are read back as local time, see load_entries
+        started = entry.started.astimezone()
+        self._failed_writer.writerow(
+            [
+                started.strftime("%Y-%m-%d"),
+                started.strftime("%H:%M:%S"),
+                entry.duration,
+                activity,
+                entry.description,
+            ]
+        )
+
+    def write(self, result: ProcessingResult) -> None:
+        record = self._record(result)
+        with self._lock:
+            if self._writer is not None:
+                self._writer.writerow(record)
+            else:
+                self._file.write(json.dumps(record) + "\n")
+            if result.entry.status == "failed" and self.failed_path is not None:
+                self._write_failed(result.entry)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+            if self._failed_file is not None:
+                self._failed_file.close()
@@ -0,0 +1,97 @@
+"""Rolling throughput, ETA and latency of a processing run"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+from autolog.constants import THROUGHPUT_WINDOW_SEC
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {(seconds % 3600) // 60}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds}s"
+
+
+class ThroughputStats(NamedTuple):
+    rate: float
+    eta: float | None
+    p95_latency: float | None
+    # "ok", "throttled" (waiting on a 429 backoff) or "cooldown"
+    jira_state: str
+
+    def __str__(self) -> str:
+        parts = [f"{self.rate:.1f}/s"]
+        if self.eta is not None:
+            parts.append(f"ETA {_format_duration(self.eta)}")
+        if self.p95_latency is not None:
+            parts.append(f"p95 {self.p95_latency * 1000:.0f} ms")
+        parts.append(f"Jira: {self.jira_state}")
+        return " | ".join(parts)
+
+
+class ThroughputMeter:
+    """
+    Keeps request latencies and completions of the last `window` seconds.
+
+    Rates are taken over the window, or over the run so far while it is
+    shorter, so the ETA follows throttling and cooldowns within a minute.
+    """
+
+    def __init__(self, window: float = THROUGHPUT_WINDOW_SEC):
+        self.window = window
+        self._started_at = time.monotonic()
+        self._latencies: deque[tuple[float, float]] = deque()
+        self._completions: deque[float] = deque()
+        self._throttled_until = 0.0
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._latencies and self._latencies[0][0] < cutoff:
+            self._latencies.popleft()
+        while self._completions and self._completions[0] < cutoff:
+            self._completions.popleft()
+
+    def record_request(self, latency: float) -> None:
+        """One request sent to Jira, including attempts that are retried."""
+        with self._lock:
+            self._latencies.append((time.monotonic(), latency))
+
+    def record_completion(self) -> None:
+        """One entry reached its final status."""
+        with self._lock:
+            self._completions.append(time.monotonic())
+
+    def throttled(self, seconds: float) -> None:
+        """Jira asked to slow down; requests wait for `seconds`."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._throttled_until = max(self._throttled_until, until)
+
+    def cooldown(self, seconds: float) -> None:
+        with self._lock:
+            self._cooldown_until = time.monotonic() + seconds
+
+    def stats(self, remaining: int) -> ThroughputStats:
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            elapsed = min(self.window, now - self._started_at)
+            rate = len(self._completions) / elapsed if elapsed > 0 else 0.0
+            latencies = sorted(latency for _, latency in self._latencies)
+            if now < self._throttled_until:
+                jira_state = "throttled"
+            elif now < self._cooldown_until:
+                jira_state = "cooldown"
+            else:
+                jira_state = "ok"
+        p95 = latencies[math.ceil(0.95 * len(latencies)) - 1] if latencies else None
+        eta = remaining / rate if rate > 0 else None
+        return ThroughputStats(rate, eta, p95, jira_state)
@@ -1,8 +1,44 @@
 # autolog/update_checker.py
 
+import json
+import logging
+import os
+import time
+
 import requests
 from packaging import version
 
+from autolog.constants import DATA_DIR
+
+UPDATE_CACHE_FILE = DATA_DIR / "latest_release.json"
+UPDATE_CACHE_TTL_SEC = 24 * 60 * 60
+
+logger = logging.getLogger(__name__)
+
+
+def update_check_enabled() -> bool:
+    """Return False when AUTOLOG_OFFLINE or AUTOLOG_NO_UPDATE_CHECK is 'True'."""
+    return not any(
+        os.environ.get(var, "False") == "True"
+        for var in ("AUTOLOG_OFFLINE", "AUTOLOG_NO_UPDATE_CHECK")
+    )
+
+
+def _read_cache(repo: str) -> dict:
+    try:
+        cache = json.loads(UPDATE_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get("repo") == repo else {}
+
+
+def _write_cache(cache: dict) -> None:
+    try:
+        UPDATE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        UPDATE_CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not cache release info: {e}")
+
 
 def get_latest_release_info(repo: str) -> dict:
     """
@@ -11,17 +47,39 @@ def get_latest_release_info(repo: str) -> dict:
       - version: tag name (string)
       - changelog: body of the release (string)
       - url: HTML URL of the release page (string)
+
+    The result is cached on disk for UPDATE_CACHE_TTL_SEC; after that the
+    cached ETag is sent so an unchanged release costs a 304 response, which
+    does not count against GitHub's rate limit.
     """
+    cache = _read_cache(repo)
+    if cache.get("info") and time.time() - cache["fetched_at"] < UPDATE_CACHE_TTL_SEC:
+        return cache["info"]
+
     url = f"https://api.github.com/repos/{repo}/releases/latest"
     headers = {"Accept": "application/vnd.github.v3+json"}
+    if cache.get("etag") and cache.get("info"):
+        headers["If-None-Match"] = cache["etag"]
     resp = requests.get(url, headers=headers, timeout=5)
-    resp.raise_for_status()
-    data = resp.json()
-    return {
-        "version": data["tag_name"],
-        "changelog": data.get("body", "").strip(),
-        "url": data["html_url"],
-    }
+    if resp.status_code == 304:
+        info = cache["info"]
+    else:
+        resp.raise_for_status()
+        data = resp.json()
+        info = {
+            "version": data["tag_name"],
+            "changelog": data.get("body", "").strip(),
+            "url": data["html_url"],
+        }
+    _write_cache(
+        {
+            "repo": repo,
+            "fetched_at": time.time(),
+            "etag": resp.headers.get("ETag", cache.get("etag")),
+            "info": info,
+        }
+    )
+    return info
 
 
 def is_update_available(current: str, latest: str) -> bool:
@@ -8,8 +8,8 @@ import customtkinter as ctk
 import pytz
 from customtkinter import ThemeManager
 
-from autolog.constants import ColumnID
-from autolog.providers.factory import get_providers_names
+from autolog.constants import DEFAULT_TIMEZONE, ColumnID
+from autolog.providers.factory import AUTO_PROVIDER, get_providers_names
 
 
 class FileSelectorFrame(ctk.CTkFrame):
@@ -19,17 +19,19 @@ class FileSelectorFrame(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self.provider_selector = ctk.CTkOptionMenu(
             self,
-            values=get_providers_names(),
+            values=[AUTO_PROVIDER, *get_providers_names()],
             width=100,
             command=self.on_provider_select,
         )
         self.file_entry = ctk.CTkEntry(self)
+        self.sheets_entry = ctk.CTkEntry(self, placeholder_text="Sheets", width=100)
         self.browse_btn = ctk.CTkButton(self, text="Browse", command=browse_callback)
         self._layout()
 
     def _layout(self) -> None:
         self.provider_selector.pack(side="left", padx=5, fill="x")
         self.file_entry.pack(side="left", padx=5, fill="x", expand=True)
+        self.sheets_entry.pack(side="left", padx=5)
         self.browse_btn.pack(side="left", padx=5)
 
     def on_provider_select(self, provider: str):
@@ -48,6 +50,12 @@ class FileSelectorFrame(ctk.CTkFrame):
     def provider_name(self) -> str:
         return self.provider_selector.get()
 
+    @property
+    def sheets(self) -> Optional[list[str]]:
+        """Comma-separated sheet names or patterns, None meaning all sheets."""
+        sheets = [s.strip() for s in self.sheets_entry.get().split(",") if s.strip()]
+        return sheets or None
+
     def set_file_path(self, path: str) -> None:
         self.file_entry.delete(0, tk.END)
         self.file_entry.insert(0, path)
@@ -100,14 +108,23 @@ class CellTooltip:
 class CredentialsFrame(ctk.CTkFrame):
     """Frame containing credential input fields."""
 
-    def __init__(self, master: ctk.CTk, **kwargs):
+    def __init__(
+        self,
+        master: ctk.CTk,
+        profile_callback: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ):
         super().__init__(master, **kwargs)
+        self.profile_selector = ctk.CTkComboBox(
+            self, values=[], width=120, command=profile_callback
+        )
         self.base_url_entry = ctk.CTkEntry(self, placeholder_text="Jira Base URL")
         self.email_entry = ctk.CTkEntry(self, placeholder_text="Email")
         self.api_key_entry = ctk.CTkEntry(self, placeholder_text="API Key", show="*")
         self._layout()
 
     def _layout(self) -> None:
+        self.profile_selector.pack(side="left", padx=5)
         self.base_url_entry.pack(side="left", padx=5, fill="x", expand=True)
         self.email_entry.pack(side="left", padx=5, fill="x", expand=True)
         self.api_key_entry.pack(side="left", padx=5, fill="x", expand=True)
@@ -120,10 +137,22 @@ class CredentialsFrame(ctk.CTkFrame):
             self.api_key_entry.get().strip(),
         )
 
+    @property
+    def profile(self) -> str:
+        return self.profile_selector.get().strip()
+
+    def set_profiles(self, profiles: list[str], selected: str) -> None:
+        self.profile_selector.configure(values=profiles)
+        self.profile_selector.set(selected)
+
     def load_credentials(self, base_url: str, email: str, api_key: str) -> None:
-        self.base_url_entry.insert(0, base_url)
-        self.email_entry.insert(0, email)
-        self.api_key_entry.insert(0, api_key)
+        for entry, value in (
+            (self.base_url_entry, base_url),
+            (self.email_entry, email),
+            (self.api_key_entry, api_key),
+        ):
+            entry.delete(0, tk.END)
+            entry.insert(0, value or "")
 
 
 class ScrollableDropdown(tk.Toplevel):
@@ -278,7 +307,11 @@ class OptionsFrame(ctk.CTkFrame):
     def __init__(self, master: ctk.CTk, **kwargs):
         super().__init__(master, **kwargs)
         self.prevent_duplicates_var = ctk.BooleanVar(value=True)
-        self.timezone_var = ctk.StringVar(value="Asia/Damascus")
+        self.skip_imported_var = ctk.BooleanVar(value=True)
+        self.use_mirror_var = ctk.BooleanVar(value=False)
+        self.columnar_var = ctk.BooleanVar(value=False)
+        self.overlap_mode_var = ctk.StringVar(value="off")
+        self.timezone_var = ctk.StringVar(value=DEFAULT_TIMEZONE)
         self._build_widgets()
         self._layout()
 
@@ -290,11 +323,34 @@ class OptionsFrame(ctk.CTkFrame):
         self.checkbox = ctk.CTkCheckBox(
             self, text="Prevent duplicate entries", variable=self.prevent_duplicates_var
         )
+        self.skip_imported_checkbox = ctk.CTkCheckBox(
+            self, text="Skip imported rows", variable=self.skip_imported_var
+        )
+        self.use_mirror_checkbox = ctk.CTkCheckBox(
+            self, text="Sync worklog mirror", variable=self.use_mirror_var
+        )
+        self.columnar_checkbox = ctk.CTkCheckBox(
+            self, text="Compact storage (large files)", variable=self.columnar_var
+        )
+        self.overlap_label = ctk.CTkLabel(self, text="Overlapping time:")
+        self.overlap_selector = ctk.CTkOptionMenu(
+            self,
+            values=["off", "flag", "skip"],
+            variable=self.overlap_mode_var,
+            width=80,
+        )
 
     def _layout(self) -> None:
-        self.tz_label.pack(side="left", padx=5)
-        self.tz_selector.pack(side="left", padx=5)
-        self.checkbox.pack(side="right", padx=10)
+        self.tz_label.grid(row=0, column=0, padx=5, pady=2, sticky="w")
+        self.tz_selector.grid(row=0, column=1, padx=5, pady=2, sticky="w")
+        self.overlap_label.grid(row=0, column=2, padx=5, pady=2, sticky="e")
+        self.overlap_selector.grid(row=0, column=3, padx=5, pady=2, sticky="w")
+        self.checkbox.grid(row=1, column=0, columnspan=2, padx=5, pady=2, sticky="w")
+        self.skip_imported_checkbox.grid(row=1, column=2, padx=5, pady=2, sticky="w")
+        self.use_mirror_checkbox.grid(row=1, column=3, padx=5, pady=2, sticky="w")
+        self.columnar_checkbox.grid(
+            row=2, column=0, columnspan=2, padx=5, pady=2, sticky="w"
+        )
 
     @property
     def selected_timezone(self) -> str:
@@ -0,0 +1,218 @@
+"""Durable work queue shared by worker processes, backed by SQLite"""
+
+import logging
+import os
+import socket
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from autolog.constants import DATA_DIR
+from autolog.exceptions import error_text
+from autolog.models import ProcessingResult, WorklogEntry
+
+WORK_QUEUE_FILE = DATA_DIR / "work_queue.db"
+# seconds a writer waits for another process to release the database
+BUSY_TIMEOUT_SEC = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL UNIQUE,
+    provider TEXT NOT NULL,
+    source TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    started TEXT NOT NULL,
+    duration INTEGER NOT NULL,
+    activity TEXT NOT NULL,
+    description TEXT,
+    issue_key TEXT,
+    timezone TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    worklog_id TEXT,
+    error TEXT,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_until);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def worker_name(profile: str) -> str:
+    """Identifies a worker process across hosts."""
+    return f"{socket.gethostname()}:{os.getpid()}:{profile}"
+
+
+class Job(NamedTuple):
+    id: int
+    entry: WorklogEntry
+    provider: str
+    source: str
+    # claims so far, including this one; above 1 a worker may have posted it
+    attempts: int
+
+
+class WorkQueue:
+    """
+    Entries waiting to be posted, shared by any number of worker processes.
+
+    Workers claim batches of pending entries under a lease and record the
+    final result of each entry. A lease that is not renewed in time expires
+    and its entries are claimed again by the next worker. Results are only
+    accepted from the worker holding the lease, so every entry is recorded
+    exactly once even if a worker that lost its lease finishes later.
+
+    Hosts can share the database on a network drive as long as the drive
+    supports file locking; the default rollback journal is used for that
+    reason instead of WAL.
+    """
+
+    def __init__(self, path: Path = WORK_QUEUE_FILE):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SEC)) as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """A connection holding the write lock until the block commits."""
+        # one connection per call, so worker threads never share one
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SEC)
+        with closing(conn):
+            conn.row_factory = sqlite3.Row
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def enqueue(self, provider: str, source: str, entries: list[WorklogEntry]) -> int:
+        """Add entries of a source; returns how many were not queued already."""
+        rows = []
+        for entry in entries:
+            row_key, content_hash = entry.fingerprint()
+            rows.append(
+                (
+                    f"{provider.lower()}::{source}::{row_key}::{content_hash}",
+                    provider,
+                    source,
+                    entry._idx,
+                    entry.started.isoformat(),
+                    entry.duration,
+                    entry.activity,
+                    entry.description,
+                    entry.issue_key,
+                    entry.timezone,
+                )
+            )
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (job_key, provider, source, row, "
+                "started, duration, activity, description, issue_key, timezone) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def claim(self, worker: str, limit: int, lease_sec: float) -> list[Job]:
+        """Lease up to limit pending entries, or entries whose lease expired."""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'pending' "
+                "OR (status = 'leased' AND lease_until < ?) ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            expired = [row for row in rows if row["status"] == "leased"]
+            if expired:
+                logger.warning(
+                    f"Re-queueing {len(expired)} entries whose lease expired, "
+                    f"last held by {expired[0]['worker']}"
+                )
+            conn.executemany(
+                "UPDATE jobs SET status = 'leased', worker = ?, lease_until = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                [(worker, now + lease_sec, row["id"]) for row in rows],
+            )
+        return [
+            Job(
+                row["id"],
+                self._entry(row),
+                row["provider"],
+                row["source"],
+                row["attempts"] + 1,
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _entry(row: sqlite3.Row) -> WorklogEntry:
+        return WorklogEntry(
+            started=datetime.fromisoformat(row["started"]),
+            duration=row["duration"],
+            activity=row["activity"],
+            description=row["description"],
+            timezone=row["timezone"],
+            raw_issue_key=row["activity"],
+            issue_key=row["issue_key"],
+            _idx=row["row"],
+        )
+
+    def renew(self, worker: str, lease_sec: float) -> int:
+        """Extend all leases a worker still holds; returns how many."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE jobs SET lease_until = ? "
+                "WHERE worker = ? AND status = 'leased'",
+                (time.time() + lease_sec, worker),
+            ).rowcount
+
+    def complete(self, job_id: int, worker: str, result: ProcessingResult) -> bool:
+        """Record an entry's final status; False if the worker lost its lease."""
+        with self._transaction() as conn:
+            return bool(
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worklog_id = ?, error = ?, "
+                    "finished_at = ?, lease_until = NULL "
+                    "WHERE id = ? AND worker = ? AND status = 'leased'",
+                    (
+                        result.entry.status,
+                        result.worklog_id,
+                        error_text(result.error),
+                        time.time(),
+                        job_id,
+                        worker,
+                    ),
+                ).rowcount
+            )
+
+    def release(self, worker: str) -> int:
+        """Put entries a worker leased but did not finish back in the queue."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = 'pending', worker = NULL, "
+                "lease_until = NULL WHERE worker = ? AND status = 'leased'",
+                (worker,),
+            ).rowcount
+
+    def counts(self) -> dict[str, int]:
+        """Entries per status: pending, leased and the final entry statuses."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def unfinished(self) -> int:
+        counts = self.counts()
+        return counts.get("pending", 0) + counts.get("leased", 0)
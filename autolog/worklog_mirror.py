@@ -0,0 +1,210 @@
+"""Local mirror of the user's Jira worklogs, synced incrementally"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import requests
+from jira import JIRA, JIRAError
+
+from autolog.constants import DATA_DIR
+
+MIRROR_DIR = DATA_DIR / "worklog_mirror"
+WORKLOG_LIST_BATCH = 1000
+ISSUE_SEARCH_BATCH = 100
+# a new mirror starts this long before the oldest entry, or before today
+MIRROR_LOOKBACK_DAYS = 30
+
+logger = logging.getLogger(__name__)
+
+
+def _millis(moment: datetime) -> int:
+    return int(moment.timestamp() * 1000)
+
+
+class WorklogMirror:
+    """
+    Keeps the current user's worklogs for one Jira site on disk.
+
+    Each sync downloads only the delta since the previous one:
+    ``/worklog/updated`` yields changed IDs, ``/worklog/list`` fetches them in
+    batches and ``/worklog/deleted`` yields removals. The feeds go by update
+    time, so a new mirror starts MIRROR_LOOKBACK_DAYS before the oldest entry
+    it is needed for instead of downloading the site's whole history, and
+    starts over from further back when older entries come along.
+
+    The feeds have no wrapper in the jira library, so they are requested with
+    a session of our own rather than through its private helpers.
+    """
+
+    def __init__(
+        self, client: JIRA, base_url: str, email: str, api_key: str, timeout: float
+    ):
+        self.client = client
+        self.api_url = f"{base_url.rstrip('/')}/rest/api/2"
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.auth = (email, api_key)
+        self.session.headers.update(
+            {"Accept": "application/json", "Content-Type": "application/json"}
+        )
+        site = hashlib.sha1(f"{base_url}|{email}".encode()).hexdigest()[:16]
+        self.path: Path = MIRROR_DIR / f"{site}.json"
+        self.since = 0
+        # update time in ms the feeds were first read from, None before a sync
+        self.covers_from: int | None = None
+        # worklog id -> {issueId, started, timeSpentSeconds, comment}
+        self.worklogs: dict[str, dict] = {}
+        self.issue_ids: dict[str, str] = {}
+        # issue id -> worklogs shaped like Jira's, rebuilt after a sync
+        self._by_issue: dict[str, list[SimpleNamespace]] | None = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable worklog mirror {self.path}: {e}")
+            return
+        self.since = data.get("since", 0)
+        # mirrors written before the lookback was added were read from the start
+        self.covers_from = data.get("covers_from", 0 if "since" in data else None)
+        self.worklogs = data.get("worklogs", {})
+        self.issue_ids = data.get("issue_ids", {})
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "since": self.since,
+                    "covers_from": self.covers_from,
+                    "worklogs": self.worklogs,
+                    "issue_ids": self.issue_ids,
+                }
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.path)
+
+    def _is_mine(self, author: dict, me: dict) -> bool:
+        for field in ("accountId", "key", "name"):
+            if me.get(field):
+                return author.get(field) == me[field]
+        return False
+
+    def _request(self, method: str, path: str, **kwargs):
+        response = self.session.request(
+            method, f"{self.api_url}/{path}", timeout=self.timeout, **kwargs
+        )
+        if not response.ok:
+            raise JIRAError(
+                response.text, response.status_code, response.url, response=response
+            )
+        return response.json()
+
+    def _changes(self, feed: str, since: int) -> tuple[list[str], int]:
+        """Collect worklog IDs from an "updated"/"deleted" feed since a timestamp."""
+        ids = []
+        while True:
+            page = self._request("GET", f"worklog/{feed}", params={"since": since})
+            ids.extend(str(v["worklogId"]) for v in page.get("values", []))
+            since = page.get("until", since)
+            if page.get("lastPage", True):
+                return ids, since
+
+    def _fetch(self, ids: list[str]) -> list[dict]:
+        worklogs = []
+        for i in range(0, len(ids), WORKLOG_LIST_BATCH):
+            batch = [int(worklog_id) for worklog_id in ids[i : i + WORKLOG_LIST_BATCH]]
+            worklogs.extend(
+                self._request("POST", "worklog/list", data=json.dumps({"ids": batch}))
+            )
+        return worklogs
+
+    def covers(self, oldest: datetime | None) -> bool:
+        """Whether a sync has read the feeds from before `oldest`."""
+        if self.covers_from is None:
+            return False
+        if oldest is None:
+            return True
+        return self.covers_from <= _millis(oldest)
+
+    def sync(self, oldest: datetime | None = None) -> None:
+        """Download worklogs changed or deleted since the last sync.
+
+        `oldest` is the earliest start of the entries the mirror is needed
+        for; the feeds are read again from before it if it is not covered.
+        """
+        if not self.covers(oldest):
+            start = oldest or datetime.now(timezone.utc)
+            self.since = _millis(start - timedelta(days=MIRROR_LOOKBACK_DAYS))
+            self.covers_from = self.since
+        me = self.client.myself()
+        updated_ids, until = self._changes("updated", self.since)
+        for worklog in self._fetch(updated_ids):
+            worklog_id = str(worklog["id"])
+            if not self._is_mine(worklog.get("author", {}), me):
+                self.worklogs.pop(worklog_id, None)
+                continue
+            self.worklogs[worklog_id] = {
+                "issueId": str(worklog["issueId"]),
+                "started": worklog["started"],
+                "timeSpentSeconds": worklog["timeSpentSeconds"],
+                "comment": worklog.get("comment", ""),
+            }
+
+        deleted_ids, _ = self._changes("deleted", self.since)
+        for worklog_id in deleted_ids:
+            self.worklogs.pop(worklog_id, None)
+
+        logger.info(
+            f"Worklog mirror synced: {len(updated_ids)} updated, "
+            f"{len(deleted_ids)} deleted, {len(self.worklogs)} total"
+        )
+        self.since = until
+        self._by_issue = None
+        self.save()
+
+    def _resolve_issue_ids(self, issue_keys: list[str]) -> None:
+        """Look up numeric IDs for issue keys not resolved yet."""
+        missing = [key for key in issue_keys if key not in self.issue_ids]
+        for i in range(0, len(missing), ISSUE_SEARCH_BATCH):
+            batch = missing[i : i + ISSUE_SEARCH_BATCH]
+            try:
+                issues = self.client.search_issues(
+                    f"key in ({','.join(batch)})",
+                    fields="id",
+                    maxResults=len(batch),
+                    validate_query=False,
+                )
+            except JIRAError as e:
+                logger.warning(f"Could not resolve issue ids for {batch}: {e}")
+                continue
+            for issue in issues:
+                self.issue_ids[issue.key] = str(issue.id)
+
+    def _index(self) -> dict[str, list[SimpleNamespace]]:
+        if self._by_issue is None:
+            self._by_issue = {}
+            for worklog_id, worklog in self.worklogs.items():
+                self._by_issue.setdefault(worklog["issueId"], []).append(
+                    SimpleNamespace(id=worklog_id, **worklog)
+                )
+        return self._by_issue
+
+    def worklogs_by_key(self, issue_keys: list[str]) -> dict[str, list]:
+        """Return mirrored worklogs grouped by issue key, shaped like Jira's."""
+        self._resolve_issue_ids(issue_keys)
+        by_issue_id = self._index()
+        return {
+            key: by_issue_id.get(self.issue_ids[key], [])
+            for key in issue_keys
+            if key in self.issue_ids
+        }
@@ -1,49 +1,211 @@
+import heapq
+import itertools
 import logging
+import sqlite3
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Tuple
+from queue import Empty, Full, Queue
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Tuple
 
 import pytz
 from jira.exceptions import JIRAError
 
-from autolog.constants import COOLDOWN_EVERY, COOLDOWN_SEC
-from autolog.exceptions import DuplicateWorklogError
+from autolog.constants import (
+    LOAD_BATCH_SIZE,
+    PIPELINE_POLL_SEC,
+    PIPELINE_QUEUE_SIZE,
+    PROGRESS_LOG_INTERVAL_SEC,
+    QUEUE_CLAIM_SIZE,
+    QUEUE_LEASE_SEC,
+    QUEUE_POLL_SEC,
+    ROLLBACK_WORKERS,
+)
+from autolog.exceptions import (
+    DuplicateWorklogError,
+    LoadCancelledError,
+    OverlappingWorklogError,
+)
+from autolog.import_history import ImportHistory
 from autolog.jira_client import JiraClient
+from autolog.keyring_manager import CredentialManager
 from autolog.models import ProcessingResult, WorklogEntry
 from autolog.parsers.issue_parser import IssueKeyParser
-from autolog.providers.factory import select_provider
+from autolog.profiling import profiled, profiled_thread
+from autolog.providers.base import ProviderBase
+from autolog.providers.factory import (
+    AUTO_PROVIDER,
+    detect_provider,
+    select_provider,
+)
+from autolog.retry import TRANSIENT_ERRORS, RetryPolicy
+from autolog.routing import RoutingRules
+from autolog.run_report import RunReport
+from autolog.throughput import ThroughputMeter, ThroughputStats
+
+if TYPE_CHECKING:
+    from autolog.entry_store import EntryStore
+    from autolog.work_queue import Job, WorkQueue
 
 logger = logging.getLogger(__file__)
 
+PROCESSABLE_STATUSES = ("pending", "failed", "skipped", "overlap")
+
+# marks the end of a pipeline stage's output
+_DONE = object()
+
 
 class WorklogProcessor:
     """Handles business logic for processing worklog entries with Jira."""
 
-    def __init__(self, credentials: Tuple[str, str, str], timezone: str):
-        """Initialize the processor with Jira credentials and settings."""
+    def __init__(
+        self,
+        credentials: Tuple[str, str, str],
+        timezone: str,
+        use_mirror: bool = False,
+        columnar: bool = False,
+        report_format: str | None = "jsonl",
+        overlap_mode: str = "off",
+    ):
+        """Initialize the processor with Jira credentials and settings.
+
+        With columnar set, loaded entries are kept in an EntryStore instead
+        of a list of WorklogEntry objects, for very large imports.
+        Results are streamed to a run report unless report_format is None.
+        overlap_mode is "off", "flag" or "skip" for entries overlapping time
+        the user already logged.
+        """
         self.credentials = credentials
+        self.use_mirror = use_mirror
+        self.columnar = columnar
+        self.overlap_mode = overlap_mode
         self.client = None
+        self.clients: dict[str | None, JiraClient] = {}
+        self.routing = RoutingRules.load()
+        self.retry_policy = RetryPolicy()
+        self._cancel_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._clients_lock = threading.Lock()
+        # site workers and undo threads finish entries concurrently
+        self._counts_lock = threading.Lock()
+        self._warm_up_thread: threading.Thread | None = None
+        self._warm_up_cancel = threading.Event()
         self.timezone = timezone
-        self.results: List[ProcessingResult] = []
-        self.failed_entries: List[ProcessingResult] = []
+        self.report_format = report_format
+        self.report: RunReport | None = None
+        # only counters are kept, per-entry results are streamed to the report
+        self.counts: Counter[str] = Counter()
         self.total: int = 0
+        self.history = ImportHistory()
+        self.provider_name: str | None = None
+        self.source: str | None = None
+        self.import_counts: dict[str, int] = {}
+        self.duplicate_count = 0
+        self.throughput = ThroughputMeter()
+        self.ambiguous_dates: list[str] = []
+
+    @profiled("load")
+    def load_entries(
+        self,
+        file_path: Path,
+        provider: str,
+        skip_imported: bool = True,
+        sheets: List[str] | None = None,
+        on_batch: Callable[[List[WorklogEntry]], None] | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> List[WorklogEntry]:
+        """Load and preprocess worklog entries from a CSV file.
 
-    def load_entries(self, file_path: Path, provider: str) -> List[WorklogEntry]:
-        """Load and preprocess worklog entries from a CSV file."""
-        provider = select_provider(name=provider, file_path=file_path)
-        entries = provider.parse()
-        total_seconds = 0
-        for idx, entry in enumerate(entries):
-            entry.status = "pending"
-            entry.issue_key = IssueKeyParser.parse(entry.raw_issue_key)
-            entry._idx = idx
-            entry.timezone = self.timezone
-            tz = pytz.timezone(entry.timezone)
-            entry.started = entry.started.astimezone(tz)
-            total_seconds += entry.duration
+        When skip_imported is set, rows already posted from the same
+        (provider, source) with identical content are marked "unchanged".
+        For workbooks, sheets limits reading to sheets matching those names
+        or glob patterns; all sheets are read by default.
+        Rows repeating an earlier row of the file are marked "duplicate".
+        on_batch receives parsed rows in batches while loading, before their
+        final status is known; setting cancel_event stops the load with
+        LoadCancelledError.
+        """
+        provider = self._open_provider(file_path, provider, sheets)
+        entries = []
+        if self.columnar:
+            # imported here so numpy stays off the startup path
+            from autolog.entry_store import EntryStore
+
+            entries = EntryStore(self.timezone)
+        tz = pytz.timezone(self.timezone)
+        batch = []
+        for idx, entry in enumerate(provider.iter_parse()):
+            if cancel_event is not None and cancel_event.is_set():
+                raise LoadCancelledError(f"Loading {file_path.name} cancelled")
+            self._prepare_entry(entry, idx, tz)
+            entries.append(entry)
+            if on_batch is not None:
+                batch.append(entry)
+                if len(batch) >= LOAD_BATCH_SIZE:
+                    on_batch(batch)
+                    batch = []
+        if batch:
+            on_batch(batch)
+        self.ambiguous_dates = provider.ambiguous_dates
+        if self.columnar:
+            total_seconds = entries.total_duration()
+        else:
+            total_seconds = sum(entry.duration for entry in entries)
+        self.import_counts = {}
+        if skip_imported:
+            self.import_counts = self.history.classify(
+                self.provider_name, self.source, entries
+            )
+        self.duplicate_count = self._mark_duplicates(entries)
         total_hours = f"{total_seconds // 3600}:{(total_seconds % 3600) // 60}"
         return entries, total_hours
 
+    def _open_provider(
+        self, file_path: Path, provider: str, sheets: List[str] | None
+    ) -> ProviderBase:
+        if provider.lower() == AUTO_PROVIDER:
+            provider = detect_provider(file_path)
+        self.provider_name = provider
+        self.source = file_path.name
+        return select_provider(name=provider, file_path=file_path, sheets=sheets)
+
+    def _prepare_entry(self, entry: WorklogEntry, idx: int, tz) -> None:
+        """Reset a parsed entry and resolve its issue key and timezone."""
+        entry.status = "pending"
+        entry.issue_key = IssueKeyParser.parse(entry.raw_issue_key)
+        entry._idx = idx
+        entry.timezone = self.timezone
+        entry.started = entry.started.astimezone(tz)
+
+    @staticmethod
+    def _mark_duplicate(entry: WorklogEntry, first_seen: dict) -> bool:
+        """Mark an entry repeating a row already in first_seen as "duplicate"."""
+        # __eq__ leaves the issue out, it only compares worklogs of one issue
+        key = (entry.issue_key, *entry.dedup_key())
+        original = first_seen.setdefault(key, entry._idx)
+        if original == entry._idx or entry.status == "unchanged":
+            return False
+        entry.status = "duplicate"
+        entry.duplicate_of = original
+        return True
+
+    @classmethod
+    def _mark_duplicates(cls, entries: List[WorklogEntry]) -> int:
+        """
+        Mark rows repeating an earlier row of the same file as "duplicate".
+
+        Rows are compared by issue and the key WorklogEntry.__eq__ uses, in
+        one pass, and each repeat remembers the index of the row it copies.
+        """
+        first_seen = {}
+        return sum(cls._mark_duplicate(entry, first_seen) for entry in entries)
+
+    @profiled("process")
     def process_entries(
         self,
         entries: List[WorklogEntry],
@@ -54,27 +216,37 @@ class WorklogProcessor:
         invoking callback for UI updates.
         """
         try:
-            self.results = []
-            self.failed_entries = []
-            self.client = JiraClient(
-                *self.credentials, prevent_duplicates=prevent_duplicates
-            )
-            self.client.connect()
-            entries_to_process = [
-                e for e in entries if e.status in ("pending", "failed", "skipped")
-            ]
+            self._start_run()
+            entries_to_process = self._select(entries, PROCESSABLE_STATUSES)
             total = len(entries_to_process)
             self.total = total
-            unique_issues = {e.issue_key for e in entries_to_process if e.issue_key}
 
-            if self.client.prevent_duplicates:
-                self.client.preload_worklogs(list(unique_issues))
+            groups = self.routing.split(entries_to_process)
+            # let a running warm-up finish its work instead of repeating it
+            if not self._join_warm_up():
+                return
+            for profile in groups:
+                self._get_client(profile, prevent_duplicates)
+            self.client = self.clients.get(None)
 
-            for idx, entry in enumerate(entries_to_process, 1):
-                result = self._process_single_entry(entry)
-                callback(idx, total, entry, result)
-                if idx % COOLDOWN_EVERY == 0 and idx != len(entries_to_process):
-                    time.sleep(COOLDOWN_SEC)
+            report = self._reporter(callback)
+            if len(groups) <= 1:
+                for profile, group in groups.items():
+                    self._process_group(self.clients[profile], group, report)
+            else:
+                # one worker per Jira site, each with its own session and cooldown
+                with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+                    futures = [
+                        pool.submit(
+                            profiled_thread(self._process_group),
+                            self.clients[profile],
+                            group,
+                            report,
+                        )
+                        for profile, group in groups.items()
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
 
         except JIRAError as e:
             logger.error(f"Jira error: {e}")
@@ -82,17 +254,641 @@ class WorklogProcessor:
         except Exception as e:
             logger.exception(f"Unexpected error: {e}")
             raise
+        finally:
+            if self.report is not None:
+                self.report.close()
+            self._record_history(entries)
+
+    @profiled("process")
+    def process_file(
+        self,
+        file_path: Path,
+        provider: str,
+        callback: Callable[[int, int, WorklogEntry, ProcessingResult], None],
+        prevent_duplicates: bool = True,
+        skip_imported: bool = True,
+        sheets: List[str] | None = None,
+    ) -> "List[WorklogEntry] | EntryStore":
+        """Load and post a file in one pipelined run, for headless use.
+
+        Parsing, checking and routing, preloading per issue and posting per
+        Jira site run as concurrent stages joined by bounded queues, so the
+        first worklogs go out while the file is still being read and a slow
+        stage holds back the ones feeding it. Returns all loaded entries
+        with their final status.
+        """
+        entries: "List[WorklogEntry] | EntryStore" = []
+        if self.columnar:
+            from autolog.entry_store import EntryStore
+
+            entries = EntryStore(self.timezone)
+        errors: list[Exception] = []
+        threads: list[threading.Thread] = []
+        sites: dict[str | None, Queue] = {}
+        parsed: Queue = Queue(PIPELINE_QUEUE_SIZE)
+        self._start_run()
+        report = self._reporter(callback)
+
+        def stage(target: Callable, *args) -> None:
+            def run():
+                try:
+                    target(*args)
+                except Exception as e:
+                    logger.exception(f"Pipeline stage failed: {e}")
+                    errors.append(e)
+                    self.cancel()
+
+            thread = threading.Thread(target=profiled_thread(run), daemon=True)
+            threads.append(thread)
+            thread.start()
+
+        def parse() -> None:
+            source = self._open_provider(file_path, provider, sheets)
+            for entry in source.iter_parse():
+                if not self._put(parsed, entry):
+                    return
+            self.ambiguous_dates = source.ambiguous_dates
+            self._put(parsed, _DONE)
+
+        def check() -> None:
+            tz = pytz.timezone(self.timezone)
+            first_seen = {}
+            for idx, entry in enumerate(self._drain(parsed)):
+                self._prepare_entry(entry, idx, tz)
+                if self.columnar:
+                    # later stages update the stored row through its view
+                    entry = entries.append(entry)
+                else:
+                    entries.append(entry)
+                if skip_imported:
+                    self.history.classify_entry(self.provider_name, self.source, entry)
+                if self._mark_duplicate(entry, first_seen):
+                    self.duplicate_count += 1
+                    continue
+                if entry.status not in PROCESSABLE_STATUSES:
+                    continue
+                self.total += 1
+                if not entry.issue_key:
+                    result = ProcessingResult(
+                        False, entry, ValueError("Missing issue key")
+                    )
+                    self._record_result(entry, result)
+                    report(entry, result)
+                    continue
+                profile = self.routing.profile_for(entry.issue_key)
+                if profile not in sites:
+                    sites[profile] = Queue(PIPELINE_QUEUE_SIZE)
+                    posting = Queue(PIPELINE_QUEUE_SIZE)
+                    stage(preload, profile, sites[profile], posting)
+                    stage(post, profile, posting)
+                if not self._put(sites[profile], entry):
+                    return
+            for site in sites.values():
+                self._put(site, _DONE)
+
+        def preload(profile: str | None, incoming: Queue, posting: Queue) -> None:
+            client = self._get_client(profile, prevent_duplicates)
+            for entry in self._drain(incoming):
+                if client.tracks_worklogs:
+                    client.preload_worklogs(
+                        [entry.issue_key], self._cancel_event, entry.started
+                    )
+                if not self._put(posting, entry):
+                    return
+            self._put(posting, _DONE)
+
+        def post(profile: str | None, posting: Queue) -> None:
+            client = self._get_client(profile, prevent_duplicates)
+            self._post(client, self._drain(posting), report)
+
+        self.duplicate_count = 0
+        try:
+            stage(parse)
+            stage(check)
+            # site stages are started by check, so the list grows while joining
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise errors[0]
+        finally:
+            if self.report is not None:
+                self.report.close()
+            self._record_history(entries)
+        return entries
+
+    def undo_run(
+        self,
+        report_path: Path,
+        callback: Callable[[int, int, WorklogEntry, ProcessingResult], None],
+    ) -> None:
+        """Delete the worklogs a run report lists as posted.
+
+        Up to ROLLBACK_WORKERS deletions run at once. They share the posting
+        cooldown, retry policy and pause/cancel controls, and their results
+        go to an "undo" report. Deleted rows are dropped from the import
+        history so the file can be imported again.
+        """
+        records = RunReport.load_posted(report_path)
+        items = [
+            (self._entry_from_record(record), record["worklog_id"])
+            for record in records
+        ]
+        try:
+            self._start_run(kind="undo")
+            self.total = len(items)
+            report = self._reporter(callback)
+            clients = {
+                profile: self._get_client(profile, self._checks_duplicates(profile))
+                for profile in {self.routing.profile_for(e.issue_key) for e, _ in items}
+            }
+            with ThreadPoolExecutor(max_workers=ROLLBACK_WORKERS) as pool:
+                futures = [
+                    pool.submit(
+                        self._delete_worklog,
+                        clients[self.routing.profile_for(entry.issue_key)],
+                        entry,
+                        worklog_id,
+                        report,
+                    )
+                    for entry, worklog_id in items
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        finally:
+            if self.report is not None:
+                self.report.close()
+            # worklogs found already deleted are gone from Jira as well
+            gone = [
+                entry for entry, _ in items if entry.status in ("deleted", "skipped")
+            ]
+            with self._updating_history() as history:
+                history.forget(gone)
+
+    @profiled("process")
+    def process_queue(
+        self,
+        queue: "WorkQueue",
+        worker: str,
+        callback: Callable[[int, int, WorklogEntry, ProcessingResult], None],
+        claim_size: int = QUEUE_CLAIM_SIZE,
+    ) -> None:
+        """Post entries claimed from a shared work queue until it is drained.
+
+        Batches are claimed under a lease that a heartbeat renews while this
+        worker runs, and each result is recorded in the queue as it arrives.
+        An entry claimed again after a lease expired may already be in Jira,
+        so the worklogs of its issue are read again and duplicates are always
+        checked. Leases still held when the run stops are released.
+        """
+        self._start_run()
+        report = self._reporter(callback)
+        claimed: dict[int, "Job"] = {}
+        finished: list["Job"] = []
+        stop_heartbeat = threading.Event()
+
+        def record(entry: WorklogEntry, result: ProcessingResult) -> None:
+            job = claimed.pop(id(entry))
+            if queue.complete(job.id, worker, result):
+                finished.append(job)
+            else:
+                logger.warning(f"Lease of {entry} was lost, result not recorded")
+            report(entry, result)
+
+        def heartbeat() -> None:
+            while not stop_heartbeat.wait(QUEUE_LEASE_SEC / 3):
+                try:
+                    queue.renew(worker, QUEUE_LEASE_SEC)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not renew work queue leases: {e}")
+
+        threading.Thread(target=heartbeat, daemon=True).start()
+        try:
+            while not self._cancel_event.is_set():
+                jobs = queue.claim(worker, claim_size, QUEUE_LEASE_SEC)
+                if not jobs:
+                    if not queue.unfinished():
+                        return
+                    # leases of other workers may still expire
+                    self._wait(QUEUE_POLL_SEC)
+                    continue
+                self.total = self.processed_count + queue.unfinished()
+                claimed.update((id(job.entry), job) for job in jobs)
+                groups = self.routing.split([job.entry for job in jobs])
+                for profile, group in groups.items():
+                    client = self._get_client(profile, prevent_duplicates=True)
+                    for key in {
+                        entry.issue_key
+                        for entry in group
+                        if claimed[id(entry)].attempts > 1
+                    }:
+                        client.refresh_worklogs(key)
+                    self._process_group(client, group, record)
+        finally:
+            stop_heartbeat.set()
+            if self.report is not None:
+                self.report.close()
+            try:
+                queue.release(worker)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not release work queue leases: {e}")
+            self._record_queued_history(finished)
+
+    def _record_queued_history(self, jobs: List["Job"]) -> None:
+        """Remember posted queue entries in this host's import history."""
+        by_source: dict[tuple[str, str], List[WorklogEntry]] = {}
+        for job in jobs:
+            by_source.setdefault((job.provider, job.source), []).append(job.entry)
+        with self._updating_history() as history:
+            # other workers on this host may have saved it meanwhile
+            history.invalidate()
+            for (provider, source), entries in by_source.items():
+                history.record(provider, source, entries)
+
+    def _checks_duplicates(self, profile: str | None) -> bool:
+        """The duplicate check of a connected client, so it is reused as is."""
+        client = self.clients.get(profile)
+        return client.prevent_duplicates if client is not None else True
+
+    def _entry_from_record(self, record: dict) -> WorklogEntry:
+        return WorklogEntry(
+            started=datetime.fromisoformat(record["started"]),
+            duration=int(record["duration"]),
+            activity=record["activity"],
+            description=record["description"],
+            timezone=self.timezone,
+            raw_issue_key=record["activity"],
+            issue_key=record["issue_key"],
+            status="success",
+            _idx=int(record["row"]),
+        )
+
+    def _delete_worklog(
+        self,
+        client: JiraClient,
+        entry: WorklogEntry,
+        worklog_id: str,
+        report: Callable[[WorklogEntry, ProcessingResult], None],
+    ) -> None:
+        attempt = 1
+        while self._pass_cooldown(client):
+            result, delay = self._send(
+                client.delete_worklog, entry, attempt, "deletion", worklog_id
+            )
+            if delay is not None:
+                if not self._wait(delay):
+                    return
+                attempt += 1
+                continue
+
+            if result.success:
+                entry.status = "deleted"
+            elif getattr(result.error, "status_code", None) == 404:
+                entry.status = "skipped"  # already deleted in Jira
+            else:
+                entry.status = "failed"
+            self._tally(entry, result)
+            self.throughput.record_completion()
+            report(entry, result)
+            return
+
+    def _send(
+        self,
+        send: Callable[..., ProcessingResult],
+        entry: WorklogEntry,
+        attempt: int,
+        action: str,
+        *args,
+    ) -> tuple[ProcessingResult, float | None]:
+        """Send send(entry, *args) once and apply the retry policy to it.
+
+        Returns the result, and the delay before the next attempt if the
+        request failed in a way worth retrying, otherwise None.
+        """
+        sent_at = time.perf_counter()
+        result = send(entry, *args)
+        result.latency = time.perf_counter() - sent_at
+        self.throughput.record_request(result.latency)
+        if result.success or not self.retry_policy.should_retry(result.error, attempt):
+            return result, None
+        delay = self.retry_policy.delay(result.error, attempt)
+        logger.warning(
+            "Retrying %s of %s in %.1fs (attempt %d): %s",
+            action,
+            entry,
+            delay,
+            attempt,
+            result.error,
+        )
+        if getattr(result.error, "status_code", None) == 429:
+            self.throughput.throttled(delay)
+        return result, delay
+
+    def _pass_cooldown(self, client: JiraClient) -> bool:
+        """Cool down the workers of a site after every few requests to it.
+
+        Returns False if the run was cancelled while waiting.
+        """
+        delay, started = client.cooldown.next_request()
+        if started:
+            self.throughput.cooldown(client.cooldown.seconds)
+        return self._wait(delay)
+
+    def _put(self, queue: Queue, item) -> bool:
+        """Put with backpressure; gives up and returns False once cancelled."""
+        while not self._cancel_event.is_set():
+            try:
+                queue.put(item, timeout=PIPELINE_POLL_SEC)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _drain(self, queue: Queue) -> Iterator:
+        """Yield items until the stage before is done or the run is cancelled."""
+        while not self._cancel_event.is_set():
+            try:
+                item = queue.get(timeout=PIPELINE_POLL_SEC)
+            except Empty:
+                continue
+            if item is _DONE:
+                return
+            yield item
+
+    def _start_run(self, kind: str = "run") -> None:
+        """Reset counters, report and events for a new run."""
+        self.counts = Counter()
+        self.total = 0
+        for client in self.clients.values():
+            client.cooldown.reset()
+        if self.report_format:
+            self.report = RunReport(
+                fmt=self.report_format, kind=kind, failed_rows=kind == "run"
+            )
+        self.retry_policy = RetryPolicy()
+        self.throughput = ThroughputMeter()
+        self._cancel_event.clear()
+        self._resume_event.set()
+
+    def _reporter(
+        self, callback: Callable[[int, int, WorklogEntry, ProcessingResult], None]
+    ) -> Callable[[WorklogEntry, ProcessingResult], None]:
+        """Wrap a UI callback to number results and log progress periodically."""
+        counter = itertools.count(1)
+        lock = threading.Lock()
+        last_logged = time.monotonic()
+
+        def report(entry: WorklogEntry, result: ProcessingResult) -> None:
+            nonlocal last_logged
+            with lock:
+                idx = next(counter)
+                callback(idx, self.total, entry, result)
+                now = time.monotonic()
+                if now - last_logged >= PROGRESS_LOG_INTERVAL_SEC:
+                    last_logged = now
+                    logger.info(
+                        "Progress %d/%d | %s", idx, self.total, self.throughput_stats()
+                    )
+
+        return report
+
+    def warm_up(
+        self, entries: List[WorklogEntry], prevent_duplicates: bool = True
+    ) -> None:
+        """Connect and preload worklogs in the background ahead of processing.
+
+        Restarting a warm-up only fetches issue keys that are not cached yet.
+        """
+        self.cancel_warm_up()
+        cancel_event = self._warm_up_cancel = threading.Event()
+        groups = self.routing.split(self._select(entries, PROCESSABLE_STATUSES))
+
+        def _worker():
+            try:
+                for profile, group in groups.items():
+                    if cancel_event.is_set():
+                        return
+                    client = self._get_client(profile, prevent_duplicates)
+                    keys = list({e.issue_key for e in group if e.issue_key})
+                    oldest = min(e.started for e in group)
+                    client.preload_worklogs(keys, cancel_event, oldest)
+            except Exception as e:
+                logger.warning(f"Cache warm-up failed: {e}")
+
+        self._warm_up_thread = threading.Thread(target=_worker, daemon=True)
+        self._warm_up_thread.start()
+
+    @staticmethod
+    def _select(
+        entries: "List[WorklogEntry] | EntryStore", statuses: tuple[str, ...]
+    ) -> List[WorklogEntry]:
+        if hasattr(entries, "select"):
+            return entries.select(statuses)
+        return [e for e in entries if e.status in statuses]
+
+    def update_credentials(self, credentials: Tuple[str, str, str]) -> None:
+        """Switch the active credentials, dropping a client warmed with old ones."""
+        if credentials == self.credentials:
+            return
+        self.cancel_warm_up()
+        with self._clients_lock:
+            self.clients.pop(None, None)
+        self.credentials = credentials
+
+    def update_settings(self, use_mirror: bool, overlap_mode: str) -> None:
+        """Switch posting settings changed since load; clients reconnect to them."""
+        if (use_mirror, overlap_mode) == (self.use_mirror, self.overlap_mode):
+            return
+        self.cancel_warm_up()
+        self.use_mirror = use_mirror
+        self.overlap_mode = overlap_mode
+
+    def refresh_clients(self) -> None:
+        """Prepare kept clients for another run, e.g. in the background service.
 
-    def _process_single_entry(self, entry: WorklogEntry) -> ProcessingResult:
-        """Process a single worklog entry and update its status."""
-        result = self.client.create_worklog(entry)
+        Clients whose saved credentials changed are dropped, the others forget
+        the worklogs they cached, as those may have changed in Jira meanwhile.
+        """
+        with self._clients_lock:
+            for profile, client in list(self.clients.items()):
+                credentials = self.credentials
+                if profile is not None:
+                    credentials = CredentialManager.get_credentials(profile)
+                if (client.base_url, client.email, client.api_key) != credentials:
+                    del self.clients[profile]
+                else:
+                    client.invalidate_worklogs()
+            self.client = self.clients.get(None)
+
+    @property
+    def processed_count(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def failed_count(self) -> int:
+        return self.processed_count - self.counts["success"]
+
+    def throughput_stats(self) -> ThroughputStats:
+        """Entries/sec, ETA, p95 latency and Jira's rate-limit state right now."""
+        return self.throughput.stats(self.total - self.processed_count)
+
+    def _join_warm_up(self) -> bool:
+        """Wait for a running warm-up. Returns False if the run was cancelled."""
+        thread = self._warm_up_thread
+        while thread is not None and thread.is_alive():
+            if self._cancel_event.is_set():
+                self.cancel_warm_up()
+                return False
+            thread.join(PIPELINE_POLL_SEC)
+        return not self._cancel_event.is_set()
+
+    def cancel_warm_up(self) -> None:
+        """Stop a running warm-up once its in-flight request completes."""
+        self._warm_up_cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._resume_event.is_set()
+
+    def pause(self) -> None:
+        """Stop taking new entries once in-flight requests complete."""
+        self._resume_event.clear()
+
+    def resume(self) -> None:
+        self._resume_event.set()
+
+    def cancel(self) -> None:
+        """Stop the run; unprocessed entries keep their current status."""
+        self._cancel_event.set()
+        self._resume_event.set()
+
+    def _wait(self, seconds: float) -> bool:
+        """Sleep unless cancelled, blocking while paused. Returns False on cancel."""
+        if seconds > 0 and self._cancel_event.wait(seconds):
+            return False
+        self._resume_event.wait()
+        return not self._cancel_event.is_set()
+
+    def _get_client(self, profile: str | None, prevent_duplicates: bool) -> JiraClient:
+        """Return a cached client; clients are kept so resumed runs reuse caches."""
+        with self._clients_lock:
+            client = self.clients.get(profile)
+            if client is None or (
+                client.prevent_duplicates,
+                client.use_mirror,
+                client.overlap_mode,
+            ) != (prevent_duplicates, self.use_mirror, self.overlap_mode):
+                client = self.clients[profile] = self._connect(
+                    profile, prevent_duplicates
+                )
+            return client
+
+    def _connect(self, profile: str | None, prevent_duplicates: bool) -> JiraClient:
+        """Create a connected client for a routed profile or the active one."""
+        credentials = self.credentials
+        if profile is not None:
+            credentials = CredentialManager.get_credentials(profile)
+            if not all(credentials):
+                raise ValueError(f"No credentials saved for Jira profile '{profile}'")
+        client = JiraClient(
+            *credentials,
+            prevent_duplicates=prevent_duplicates,
+            use_mirror=self.use_mirror,
+            overlap_mode=self.overlap_mode,
+        )
+        client.connect()
+        return client
+
+    def _process_group(
+        self,
+        client: JiraClient,
+        entries: List[WorklogEntry],
+        report: Callable[[WorklogEntry, ProcessingResult], None],
+    ) -> None:
+        """Post all entries that belong to a single Jira site."""
+        if client.tracks_worklogs:
+            client.preload_worklogs(
+                list({e.issue_key for e in entries if e.issue_key}),
+                self._cancel_event,
+                min(e.started for e in entries),
+            )
+        self._post(client, entries, report)
+
+    def _post(
+        self,
+        client: JiraClient,
+        entries: Iterable[WorklogEntry],
+        report: Callable[[WorklogEntry, ProcessingResult], None],
+    ) -> None:
+        """Post entries as they come, retrying transient failures after them."""
+        fresh = iter(entries)
+        # (ready_at, seq, attempt, entry): retries are re-queued behind fresh work
+        retries = []
+        seq = 0
+        while True:
+            entry = next(fresh, None)
+            if entry is not None:
+                attempt = 1
+                ready_at = 0.0
+            elif retries:
+                ready_at, _, attempt, entry = heapq.heappop(retries)
+            else:
+                return
+            # counted per site across claimed batches, shared by its workers
+            if not self._pass_cooldown(client) or not self._wait(
+                ready_at - time.monotonic()
+            ):
+                return
+
+            result, delay = self._send(client.create_worklog, entry, attempt, "post")
+            if delay is not None:
+                if isinstance(result.error, TRANSIENT_ERRORS):
+                    client.refresh_worklogs(entry.issue_key)
+                heapq.heappush(
+                    retries, (time.monotonic() + delay, seq, attempt + 1, entry)
+                )
+                seq += 1
+                continue
+
+            self._record_result(entry, result)
+            self.throughput.record_completion()
+            report(entry, result)
+
+    def _record_history(self, entries: List[WorklogEntry]) -> None:
+        """Persist hashes of posted rows so the next import can skip them."""
+        if not self.provider_name:
+            return
+        with self._updating_history() as history:
+            history.record(self.provider_name, self.source, entries)
+
+    @contextmanager
+    def _updating_history(self) -> Iterator[ImportHistory]:
+        """Change the import history and save it; failing to is only logged."""
+        try:
+            yield self.history
+            self.history.save()
+        except OSError as e:
+            logger.warning(f"Could not save import history: {e}")
+
+    def _record_result(self, entry: WorklogEntry, result: ProcessingResult) -> None:
+        """Update an entry's status from its final processing result."""
         if result.success:
             entry.status = "success"
         elif isinstance(result.error, DuplicateWorklogError):
             entry.status = "skipped"
+        elif isinstance(result.error, OverlappingWorklogError):
+            # not in Jira, so not recorded in the import history either
+            entry.status = "overlap"
         else:
             entry.status = "failed"
-        self.results.append(result)
-        if not result.success:
-            self.failed_entries.append(result)
-        return result
+        self._tally(entry, result)
+
+    def _tally(self, entry: WorklogEntry, result: ProcessingResult) -> None:
+        """Count an entry's final status and add its result to the report."""
+        with self._counts_lock:
+            self.counts[entry.status] += 1
+        if self.report is not None:
+            self.report.write(result)
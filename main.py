@@ -1,8 +1,40 @@
+import multiprocessing
+import os
+import sys
+
 from autolog import logging_config
-from autolog.app import WorklogApp
+from autolog.cli import (
+    build_parser,
+    run_daemon,
+    run_enqueue,
+    run_headless,
+    run_undo,
+    run_worker,
+)
 
 if __name__ == "__main__":
+    # worker processes of the frozen executable re-enter here
+    multiprocessing.freeze_support()
+
+    args, _ = build_parser().parse_known_args()
+    if args.profile:
+        os.environ["AUTOLOG_PROFILE"] = "True"
+
     logging_config.setup_logging()
 
+    if args.daemon:
+        sys.exit(run_daemon())
+    if args.enqueue:
+        sys.exit(run_enqueue(args))
+    if args.worker:
+        sys.exit(run_worker(args))
+    if args.undo:
+        sys.exit(run_undo(args))
+    if args.headless:
+        sys.exit(run_headless(args))
+
+    # imported here so headless runs don't load the GUI toolkit
+    from autolog.app import WorklogApp
+
     app = WorklogApp()
     app.mainloop()